@@ -14,7 +14,7 @@ from onsitereview.rules.base import RuleResult
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchProgress:
     """Progress tracking for batch evaluation."""
 
@@ -22,7 +22,7 @@ class BatchProgress:
     completed: int = 0
     failed: int = 0
     current_ticket: str = ""
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)
 
     @property
     def percentage(self) -> float:
@@ -34,7 +34,7 @@ class BatchProgress:
     @property
     def elapsed_seconds(self) -> float:
         """Get elapsed time in seconds."""
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
 
     @property
     def estimated_remaining_seconds(self) -> float:
@@ -46,7 +46,7 @@ class BatchProgress:
         return avg_time * remaining
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketEvaluationResult:
     """Result of evaluating a single ticket in a batch."""
 
@@ -57,7 +57,7 @@ class TicketEvaluationResult:
     evaluation_time_seconds: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Complete result of a batch evaluation."""
 
@@ -102,7 +102,7 @@ class BatchLLMEvaluator:
         Returns:
             BatchResult with all evaluation results
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         self.client.reset_usage()
 
         progress = BatchProgress(total=len(tickets))
@@ -114,7 +114,7 @@ class BatchLLMEvaluator:
             if progress_callback:
                 progress_callback(progress)
 
-            ticket_start = time.time()
+            ticket_start = time.monotonic()
 
             try:
                 rule_results = self.evaluator.evaluate_ticket(ticket)
@@ -123,7 +123,7 @@ class BatchLLMEvaluator:
                     ticket_number=ticket.number,
                     success=True,
                     rule_results=rule_results,
-                    evaluation_time_seconds=time.time() - ticket_start,
+                    evaluation_time_seconds=time.monotonic() - ticket_start,
                 ))
                 progress.completed += 1
 
@@ -133,7 +133,7 @@ class BatchLLMEvaluator:
                     ticket_number=ticket.number,
                     success=False,
                     error=str(e),
-                    evaluation_time_seconds=time.time() - ticket_start,
+                    evaluation_time_seconds=time.monotonic() - ticket_start,
                 ))
                 progress.failed += 1
 
@@ -143,7 +143,7 @@ class BatchLLMEvaluator:
                     ticket_number=ticket.number,
                     success=False,
                     error=str(e),
-                    evaluation_time_seconds=time.time() - ticket_start,
+                    evaluation_time_seconds=time.monotonic() - ticket_start,
                 ))
                 progress.failed += 1
 
@@ -156,7 +156,7 @@ class BatchLLMEvaluator:
             total_tickets=len(tickets),
             successful=progress.completed,
             failed=progress.failed,
-            total_time_seconds=time.time() - start_time,
+            total_time_seconds=time.monotonic() - start_time,
             token_usage=self.client.token_usage,
         )
 
@@ -174,7 +174,7 @@ class BatchLLMEvaluator:
         Returns:
             BatchResult with all evaluation results
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         self.client.reset_usage()
 
         progress = BatchProgress(total=len(tickets))
@@ -182,7 +182,7 @@ class BatchLLMEvaluator:
 
         async def evaluate_one(ticket: ServiceNowTicket) -> TicketEvaluationResult:
             async with semaphore:
-                ticket_start = time.time()
+                ticket_start = time.monotonic()
 
                 try:
                     loop = asyncio.get_event_loop()
@@ -202,7 +202,7 @@ class BatchLLMEvaluator:
                         ticket_number=ticket.number,
                         success=True,
                         rule_results=rule_results,
-                        evaluation_time_seconds=time.time() - ticket_start,
+                        evaluation_time_seconds=time.monotonic() - ticket_start,
                     )
 
                 except LLMError as e:
@@ -216,7 +216,7 @@ class BatchLLMEvaluator:
                         ticket_number=ticket.number,
                         success=False,
                         error=str(e),
-                        evaluation_time_seconds=time.time() - ticket_start,
+                        evaluation_time_seconds=time.monotonic() - ticket_start,
                     )
 
                 except Exception as e:
@@ -230,7 +230,7 @@ class BatchLLMEvaluator:
                         ticket_number=ticket.number,
                         success=False,
                         error=str(e),
-                        evaluation_time_seconds=time.time() - ticket_start,
+                        evaluation_time_seconds=time.monotonic() - ticket_start,
                     )
 
         # Run all evaluations concurrently
@@ -241,7 +241,7 @@ class BatchLLMEvaluator:
             total_tickets=len(tickets),
             successful=progress.completed,
             failed=progress.failed,
-            total_time_seconds=time.time() - start_time,
+            total_time_seconds=time.monotonic() - start_time,
             token_usage=self.client.token_usage,
         )
 
@@ -257,7 +257,7 @@ class BatchLLMEvaluator:
         Returns:
             TicketEvaluationResult
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             rule_results = self.evaluator.evaluate_ticket(ticket)
@@ -266,7 +266,7 @@ class BatchLLMEvaluator:
                 ticket_number=ticket.number,
                 success=True,
                 rule_results=rule_results,
-                evaluation_time_seconds=time.time() - start_time,
+                evaluation_time_seconds=time.monotonic() - start_time,
             )
 
         except Exception as e:
@@ -275,5 +275,5 @@ class BatchLLMEvaluator:
                 ticket_number=ticket.number,
                 success=False,
                 error=str(e),
-                evaluation_time_seconds=time.time() - start_time,
+                evaluation_time_seconds=time.monotonic() - start_time,
             )
@@ -1,5 +1,6 @@
 """Evaluation result models for onsitereview."""
 
+from bisect import bisect_right
 from datetime import datetime
 from enum import Enum
 
@@ -24,15 +25,7 @@ class PerformanceBand(str, Enum):
     @classmethod
     def from_percentage(cls, percentage: float) -> "PerformanceBand":
         """Determine performance band from percentage score."""
-        if percentage >= 95:
-            return cls.BLUE
-        if percentage >= 90:
-            return cls.GREEN
-        if percentage >= 75:
-            return cls.YELLOW
-        if percentage >= 50:
-            return cls.RED
-        return cls.PURPLE
+        return _BANDS_BY_THRESHOLD[bisect_right(_BAND_THRESHOLDS, percentage)]
 
     @property
     def display_name(self) -> str:
@@ -42,14 +35,27 @@ class PerformanceBand(str, Enum):
     @property
     def css_color(self) -> str:
         """CSS color for the band."""
-        colors = {
-            "blue": "#3B82F6",
-            "green": "#22C55E",
-            "yellow": "#EAB308",
-            "red": "#EF4444",
-            "purple": "#A855F7",
-        }
-        return colors[self.value]
+        return _BAND_CSS_COLORS[self.value]
+
+
+# Lower bounds (inclusive) of each band above PURPLE, ascending
+_BAND_THRESHOLDS: tuple[float, ...] = (50, 75, 90, 95)
+_BANDS_BY_THRESHOLD: tuple[PerformanceBand, ...] = (
+    PerformanceBand.PURPLE,
+    PerformanceBand.RED,
+    PerformanceBand.YELLOW,
+    PerformanceBand.GREEN,
+    PerformanceBand.BLUE,
+)
+
+# CSS colors per band value
+_BAND_CSS_COLORS: dict[str, str] = {
+    "blue": "#3B82F6",
+    "green": "#22C55E",
+    "yellow": "#EAB308",
+    "red": "#EF4444",
+    "purple": "#A855F7",
+}
 
 
 class CriterionScore(BaseModel):
@@ -1,9 +1,45 @@
 """ServiceNow ticket data model."""
 
+import re
 from datetime import datetime
 
 from pydantic import BaseModel, Field, field_validator
 
+# Short description LoB prefixes (upper-cased) to canonical LoB names
+_LOB_PREFIXES: dict[str, str] = {
+    "MARSH": "Marsh",
+    "MERCER": "Mercer",
+    "GC": "Guy Carpenter",
+    "GUY CARPENTER": "Guy Carpenter",
+    "OW": "Oliver Wyman",
+    "OLIVER WYMAN": "Oliver Wyman",
+    "MMC": "MMC Corporate",
+    "MMC-NCL": "MMC Corporate",
+}
+
+# A known LoB prefix followed by a "-" or " - " separator
+_LOB_PREFIX_RE = re.compile(
+    r"\s*(MMC-NCL|GUY CARPENTER|OLIVER WYMAN|MARSH|MERCER|MMC|GC|OW)\s*-",
+    re.IGNORECASE,
+)
+
+
+def lob_from_short_description(short_description: str) -> str | None:
+    """Extract the Line of Business from a short description prefix.
+
+    Format can be "LoB - Location - App - Brief" or "LoB-Location-App-Brief".
+
+    Args:
+        short_description: Ticket short description
+
+    Returns:
+        LoB name or None if no known prefix is present
+    """
+    match = _LOB_PREFIX_RE.match(short_description)
+    if match:
+        return _LOB_PREFIXES[match.group(1).upper()]
+    return None
+
 
 class ServiceNowTicket(BaseModel):
     """Parsed ServiceNow incident ticket with relevant fields for evaluation."""
@@ -103,36 +139,7 @@ class ServiceNowTicket(BaseModel):
         if self.u_mmc_corporate:
             return "MMC Corporate"
 
-        lob_map = {
-            "MARSH": "Marsh",
-            "MERCER": "Mercer",
-            "GC": "Guy Carpenter",
-            "GUY CARPENTER": "Guy Carpenter",
-            "OW": "Oliver Wyman",
-            "OLIVER WYMAN": "Oliver Wyman",
-            "MMC": "MMC Corporate",
-            "MMC-NCL": "MMC Corporate",
-        }
-
-        # Try " - " separator first (standard format)
-        if " - " in self.short_description:
-            prefix = self.short_description.split(" - ")[0].strip().upper()
-            if prefix in lob_map:
-                return lob_map[prefix]
-
-        # Try "-" separator (alternative format like "Marsh-Mumbai-LAN-...")
-        if "-" in self.short_description:
-            prefix = self.short_description.split("-")[0].strip().upper()
-            if prefix in lob_map:
-                return lob_map[prefix]
-            # Also check first two parts for "MMC-NCL" style
-            parts = self.short_description.split("-")
-            if len(parts) >= 2:
-                compound = f"{parts[0].strip()}-{parts[1].strip()}".upper()
-                if compound in lob_map:
-                    return lob_map[compound]
-
-        return "Unknown"
+        return lob_from_short_description(self.short_description) or "Unknown"
 
     @property
     def is_closed(self) -> bool:
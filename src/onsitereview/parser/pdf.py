@@ -11,6 +11,13 @@ import pdfplumber
 
 from onsitereview.models.ticket import ServiceNowTicket
 
+# Patterns applied per line / per field while parsing
+_HEADER_FOOTER_RE = re.compile(r"^(Run By|Page \d|Incident Details)", re.IGNORECASE)
+_LEADING_NUMBER_RE = re.compile(r"(\d+)")
+_EMBEDDED_DATETIME_RE = re.compile(
+    r"(\d{1,2}/\d{1,2}/\d{4}\s+\d{1,2}:\d{2}(?::\d{2})?\s*(?:[AP]M)?)", re.IGNORECASE
+)
+
 
 class PDFParser:
     """Parse ServiceNow incident PDFs into ticket objects."""
@@ -47,6 +54,15 @@ class PDFParser:
         "additional_comments": r"Additional comments:\s*\n([\s\S]+?)(?=\nWork notes:|Variables|Related|$)",
     }
 
+    # Compiled once per class rather than resolved on every search
+    _FIELD_REGEXES = {
+        name: re.compile(pattern, re.IGNORECASE) for name, pattern in FIELD_PATTERNS.items()
+    }
+    _MULTILINE_REGEXES = {
+        name: re.compile(pattern, re.IGNORECASE | re.DOTALL)
+        for name, pattern in MULTILINE_FIELDS.items()
+    }
+
     def parse_file(self, file_path: str) -> ServiceNowTicket | None:
         """Parse a PDF file into a ServiceNowTicket.
 
@@ -91,14 +107,14 @@ class PDFParser:
         fields = {}
 
         # Single-line fields
-        for field_name, pattern in self.FIELD_PATTERNS.items():
-            match = re.search(pattern, text, re.IGNORECASE)
+        for field_name, regex in self._FIELD_REGEXES.items():
+            match = regex.search(text)
             if match:
                 fields[field_name] = match.group(1).strip()
 
         # Multi-line fields
-        for field_name, pattern in self.MULTILINE_FIELDS.items():
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for field_name, regex in self._MULTILINE_REGEXES.items():
+            match = regex.search(text)
             if match:
                 value = match.group(1).strip()
                 # Clean up the value
@@ -119,23 +135,20 @@ class PDFParser:
         cleaned_lines = []
         for line in lines:
             # Skip lines that look like headers/footers
-            if re.match(r"^(Run By|Page \d|Incident Details)", line, re.IGNORECASE):
+            if _HEADER_FOOTER_RE.match(line):
                 continue
-            # Skip timestamp lines at start of comments
-            if re.match(r"^\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}", line):
-                # Keep these - they're part of work notes
-                pass
+            # Timestamp lines at start of comments are kept - they're part of work notes
             cleaned_lines.append(line)
         return "\n".join(cleaned_lines).strip()
 
     def _extract_priority_number(self, priority_str: str) -> str:
         """Extract priority number from string like '5 - Minimal'."""
-        match = re.match(r"(\d+)", priority_str)
+        match = _LEADING_NUMBER_RE.match(priority_str)
         return match.group(1) if match else "3"
 
     def _extract_impact_urgency(self, value_str: str) -> str:
         """Extract impact/urgency number from string like '3 - Low'."""
-        match = re.match(r"(\d+)", value_str)
+        match = _LEADING_NUMBER_RE.match(value_str)
         return match.group(1) if match else "3"
 
     def _extract_state_value(self, state_str: str) -> str:
@@ -246,7 +259,7 @@ class PDFParser:
                 continue
 
         # Try to extract just the date/time part if there's extra text
-        match = re.search(r"(\d{1,2}/\d{1,2}/\d{4}\s+\d{1,2}:\d{2}(?::\d{2})?\s*(?:[AP]M)?)", date_str, re.IGNORECASE)
+        match = _EMBEDDED_DATETIME_RE.search(date_str)
         if match:
             extracted = match.group(1).strip()
             for fmt in formats:
@@ -5,13 +5,22 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
-from onsitereview.models.ticket import ServiceNowTicket
+from onsitereview.models.ticket import ServiceNowTicket, lob_from_short_description
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 # ServiceNow datetime format
 SERVICENOW_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Common spellings of ServiceNow boolean strings
+_TRUE_STRINGS = frozenset({"true", "True", "TRUE"})
+_FALSE_STRINGS = frozenset({"false", "False", "FALSE"})
+
 
 class ServiceNowParser:
     """Parse ServiceNow JSON exports into ticket models."""
@@ -32,9 +41,27 @@ class ServiceNowParser:
         """
         logger.info(f"Parsing ServiceNow JSON file: {path}")
 
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            content = f.read()
+
+        return self.parse_bytes(content)
+
+    def parse_bytes(self, content: bytes) -> list[ServiceNowTicket]:
+        """Parse raw JSON bytes containing ServiceNow records.
+
+        Uses orjson when installed, otherwise the standard library json.
+
+        Args:
+            content: UTF-8 encoded JSON document
 
+        Returns:
+            List of parsed ServiceNowTicket objects
+
+        Raises:
+            json.JSONDecodeError: If content is invalid JSON
+            ValueError: If JSON structure is invalid
+        """
+        data = orjson.loads(content) if orjson else json.loads(content)
         return self.parse_json(data)
 
     def parse_json(self, data: dict) -> list[ServiceNowTicket]:
@@ -158,6 +185,11 @@ class ServiceNowParser:
         """
         if isinstance(value, bool):
             return value
+        if isinstance(value, str):
+            if value in _TRUE_STRINGS:
+                return True
+            if value in _FALSE_STRINGS:
+                return False
         return str(value).lower() == "true"
 
     def _parse_int(self, value: str | int) -> int:
@@ -188,8 +220,30 @@ class ServiceNowParser:
         if not value or not value.strip():
             return None
 
+        value = value.strip()
         try:
-            return datetime.strptime(value.strip(), SERVICENOW_DATETIME_FORMAT)
+            # Fast path for the canonical zero-padded layout; strptime
+            # re-resolves the format string on every call. Fields must be
+            # ASCII digits, since int() would also accept signs, spaces and
+            # other scripts' digits.
+            if (
+                len(value) == 19
+                and value.isascii()
+                and value[4] == value[7] == "-"
+                and value[10] == " "
+                and value[13] == value[16] == ":"
+            ):
+                fields = (
+                    value[0:4],
+                    value[5:7],
+                    value[8:10],
+                    value[11:13],
+                    value[14:16],
+                    value[17:19],
+                )
+                if all(field.isdigit() for field in fields):
+                    return datetime(*map(int, fields))
+            return datetime.strptime(value, SERVICENOW_DATETIME_FORMAT)
         except ValueError:
             logger.warning(f"Failed to parse datetime: {value}")
             return None
@@ -216,39 +270,7 @@ class ServiceNowParser:
             return "MMC Corporate"
 
         # Try to extract from short_description prefix
-        # Format can be "LoB - Location - App - Brief" or "LoB-Location-App-Brief"
-        short_desc = raw.get("short_description", "")
-
-        lob_map = {
-            "MARSH": "Marsh",
-            "MERCER": "Mercer",
-            "GC": "Guy Carpenter",
-            "GUY CARPENTER": "Guy Carpenter",
-            "OW": "Oliver Wyman",
-            "OLIVER WYMAN": "Oliver Wyman",
-            "MMC": "MMC Corporate",
-            "MMC-NCL": "MMC Corporate",
-        }
-
-        # Try " - " separator first (standard format)
-        if " - " in short_desc:
-            prefix = short_desc.split(" - ")[0].strip().upper()
-            if prefix in lob_map:
-                return lob_map[prefix]
-
-        # Try "-" separator (alternative format like "Marsh-Mumbai-LAN-...")
-        if "-" in short_desc:
-            prefix = short_desc.split("-")[0].strip().upper()
-            if prefix in lob_map:
-                return lob_map[prefix]
-            # Also check first two parts for "MMC-NCL" style
-            parts = short_desc.split("-")
-            if len(parts) >= 2:
-                compound = f"{parts[0].strip()}-{parts[1].strip()}".upper()
-                if compound in lob_map:
-                    return lob_map[compound]
-
-        return None
+        return lob_from_short_description(raw.get("short_description", ""))
 
     def _compute_resolution_time(
         self, opened: datetime, resolved: datetime
@@ -5,6 +5,7 @@ import logging
 import time
 from collections import Counter
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -18,8 +19,11 @@ from onsitereview.scoring.evaluator import TicketEvaluator
 
 logger = logging.getLogger(__name__)
 
+# Band values in enum order; seeds the per-batch band_distribution
+_BAND_VALUES: tuple[str, ...] = tuple(band.value for band in PerformanceBand)
 
-@dataclass
+
+@dataclass(slots=True)
 class BatchProgress:
     """Progress information for batch processing."""
 
@@ -27,7 +31,7 @@ class BatchProgress:
     completed: int
     current_ticket: str | None = None
     errors: int = 0
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)
 
     @property
     def percentage(self) -> float:
@@ -37,7 +41,7 @@ class BatchProgress:
 
     @property
     def elapsed_seconds(self) -> float:
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
 
     @property
     def estimated_remaining_seconds(self) -> float:
@@ -48,7 +52,7 @@ class BatchProgress:
         return avg_time * remaining
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Complete result from batch evaluation."""
 
@@ -74,34 +78,59 @@ class BatchTicketEvaluator:
         tickets: list[ServiceNowTicket],
         progress_callback: Callable[[BatchProgress], None] | None = None,
     ) -> BatchResult:
-        """Evaluate a batch of tickets sequentially."""
-        start_time = time.time()
-        results: list[EvaluationResult] = []
-        errors: list[tuple[str, str]] = []
-
-        progress = BatchProgress(total=len(tickets), completed=0)
+        """Evaluate a batch of tickets on a pool of worker threads.
 
-        for ticket in tickets:
-            progress.current_ticket = ticket.number
+        Up to ``concurrency`` tickets are evaluated at once. Results and
+        errors keep the input ticket order, and ``progress_callback`` is
+        always invoked from the calling thread, with ``current_ticket`` set
+        to the ticket that just finished. If the callback raises, tickets
+        not yet started are cancelled and the exception propagates.
+        """
+        start_time = time.monotonic()
+        outcomes: list[EvaluationResult | Exception | None] = [None] * len(tickets)
 
-            if progress_callback:
-                progress_callback(progress)
+        progress = BatchProgress(total=len(tickets), completed=0)
+        if progress_callback:
+            progress_callback(progress)
 
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {
+                executor.submit(self.evaluator.evaluate_ticket, ticket): index
+                for index, ticket in enumerate(tickets)
+            }
             try:
-                result = self.evaluator.evaluate_ticket(ticket)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error evaluating {ticket.number}: {e}")
-                errors.append((ticket.number, str(e)))
-                progress.errors += 1
+                for future in as_completed(futures):
+                    index = futures[future]
+                    ticket = tickets[index]
+                    try:
+                        outcomes[index] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error evaluating {ticket.number}: {e}")
+                        outcomes[index] = e
+                        progress.errors += 1
 
-            progress.completed += 1
+                    progress.completed += 1
+                    progress.current_ticket = ticket.number
+                    if progress_callback:
+                        progress_callback(progress)
+            except BaseException:
+                # Aborted (e.g. a Streamlit stop/rerun raised from the callback):
+                # drop queued tickets so they make no further LLM calls
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        results = [o for o in outcomes if isinstance(o, EvaluationResult)]
+        errors = [
+            (ticket.number, str(outcome))
+            for ticket, outcome in zip(tickets, outcomes, strict=True)
+            if isinstance(outcome, Exception)
+        ]
 
         progress.current_ticket = None
         if progress_callback:
             progress_callback(progress)
 
-        total_time = time.time() - start_time
+        total_time = time.monotonic() - start_time
         summary = self.generate_summary(results)
         summary.total_evaluation_time_seconds = total_time
 
@@ -118,7 +147,7 @@ class BatchTicketEvaluator:
         progress_callback: Callable[[BatchProgress], None] | None = None,
     ) -> BatchResult:
         """Evaluate a batch of tickets with concurrency."""
-        start_time = time.time()
+        start_time = time.monotonic()
         semaphore = asyncio.Semaphore(self.concurrency)
 
         progress = BatchProgress(total=len(tickets), completed=0)
@@ -154,7 +183,7 @@ class BatchTicketEvaluator:
         if progress_callback:
             progress_callback(progress)
 
-        total_time = time.time() - start_time
+        total_time = time.monotonic() - start_time
         summary = self.generate_summary(results)
         summary.total_evaluation_time_seconds = total_time
 
@@ -183,29 +212,26 @@ class BatchTicketEvaluator:
             )
 
         total = len(results)
-        passed = sum(1 for r in results if r.passed)
-        failed = total - passed
-
-        avg_score = sum(r.total_score for r in results) / total
-        avg_percentage = sum(r.percentage for r in results) / total
-
-        band_counts: Counter[str] = Counter()
-        for result in results:
-            band_counts[result.band.value] += 1
-
-        band_distribution = {
-            band.value: band_counts.get(band.value, 0)
-            for band in PerformanceBand
-        }
-
+        passed = 0
+        score_sum = 0
+        percentage_sum = 0.0
+        band_counts = dict.fromkeys(_BAND_VALUES, 0)
         issue_counts: Counter[str] = Counter()
+
+        # One pass over the results for all the aggregates below
         for result in results:
+            percentage = result.percentage
+            passed += result.passed
+            score_sum += result.total_score
+            percentage_sum += percentage
+            band_counts[PerformanceBand.from_percentage(percentage).value] += 1
             for improvement in result.improvements:
-                if ": " in improvement:
-                    criterion = improvement.split(": ")[0]
-                    issue_counts[criterion] += 1
-                else:
-                    issue_counts[improvement] += 1
+                # Count by criterion name ("Criterion: coaching") when present
+                issue_counts[improvement.partition(": ")[0]] += 1
+
+        failed = total - passed
+        avg_score = score_sum / total
+        avg_percentage = percentage_sum / total
 
         common_issues = [issue for issue, _ in issue_counts.most_common(5)]
 
@@ -215,7 +241,7 @@ class BatchTicketEvaluator:
             failed_count=failed,
             average_score=round(avg_score, 1),
             average_percentage=round(avg_percentage, 1),
-            band_distribution=band_distribution,
+            band_distribution=band_counts,
             common_issues=common_issues,
             evaluated_at=datetime.now(),
         )
@@ -1,12 +1,13 @@
 """Scoring calculator for onsitereview - Onsite Support Review (90 points)."""
 
 from dataclasses import dataclass
+from itertools import chain
 
 from onsitereview.models.evaluation import PerformanceBand
 from onsitereview.rules.base import RuleResult
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScoringResult:
     """Result of score calculation."""
 
@@ -35,8 +36,7 @@ class ScoringCalculator:
 
         Simply sums all positive scores. No deductions, no auto-fail.
         """
-        all_results = rule_results + llm_results
-        total_score = sum(r.score for r in all_results)
+        total_score = sum(r.score for r in chain(rule_results, llm_results))
 
         # Cap at max score
         total_score = min(total_score, self.MAX_SCORE)
@@ -78,7 +78,7 @@ class TicketEvaluator:
         5. Assign performance band
         6. Build EvaluationResult
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Step 1: Run rules evaluation
         logger.debug(f"Running rules evaluation for {ticket.number}")
@@ -105,7 +105,7 @@ class TicketEvaluator:
         strengths = self.formatter.collect_strengths(all_results)
         improvements = self.formatter.collect_improvements(all_results)
 
-        evaluation_time = time.time() - start_time
+        evaluation_time = time.monotonic() - start_time
 
         # Step 6: Build final result
         return EvaluationResult(
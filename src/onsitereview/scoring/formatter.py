@@ -1,8 +1,14 @@
 """Result formatting utilities for onsitereview scoring - Onsite Support Review."""
 
+from itertools import chain
+
 from onsitereview.models.evaluation import CriterionScore
 from onsitereview.rules.base import RuleResult
-from onsitereview.scoring.templates import get_criteria, get_criterion_by_id
+from onsitereview.scoring.templates import (
+    TemplateCriterion,
+    get_criteria,
+    get_criterion_by_id,
+)
 
 
 class ResultFormatter:
@@ -17,50 +23,35 @@ class ResultFormatter:
         llm_results: list[RuleResult],
     ) -> list[CriterionScore]:
         """Convert RuleResults to CriterionScores for display."""
-        all_results = {r.criterion_id: r for r in rule_results}
-        all_results.update({r.criterion_id: r for r in llm_results})
-
-        criterion_scores = []
-
-        for criterion in get_criteria():
-            if criterion.criterion_id not in all_results:
-                continue
-
-            result = all_results[criterion.criterion_id]
-            points_awarded = max(0, result.score)
-
-            criterion_scores.append(
-                CriterionScore(
-                    criterion_id=criterion.criterion_id,
-                    criterion_name=criterion.criterion_name,
-                    max_points=criterion.max_points,
-                    points_awarded=points_awarded,
-                    evidence=result.evidence,
-                    reasoning=result.reasoning,
-                    coaching=result.coaching,
-                )
+        # LLM results override rule results for the same criterion
+        all_results = {r.criterion_id: r for r in chain(rule_results, llm_results)}
+
+        return [
+            CriterionScore(
+                criterion_id=criterion.criterion_id,
+                criterion_name=criterion.criterion_name,
+                max_points=criterion.max_points,
+                points_awarded=max(0, result.score),
+                evidence=result.evidence,
+                reasoning=result.reasoning,
+                coaching=result.coaching,
             )
-
-        return criterion_scores
+            for criterion in get_criteria()
+            if (result := all_results.get(criterion.criterion_id)) is not None
+        ]
 
     def collect_strengths(
         self,
         results: list[RuleResult],
     ) -> list[str]:
         """Extract strength statements from high-scoring criteria."""
-        strengths = []
-
-        for result in results:
-            criterion = get_criterion_by_id(result.criterion_id)
-            if not criterion or criterion.max_points == 0:
-                continue
-
-            percentage = result.score / criterion.max_points
-
-            if percentage >= self.STRENGTH_THRESHOLD:
-                strength_text = f"{criterion.criterion_name}: {result.reasoning}"
-                strengths.append(strength_text)
-
+        strengths = [
+            f"{criterion.criterion_name}: {result.reasoning}"
+            for result in results
+            if (criterion := get_criterion_by_id(result.criterion_id))
+            and criterion.max_points
+            and result.score / criterion.max_points >= self.STRENGTH_THRESHOLD
+        ]
         return strengths[:5]
 
     def collect_improvements(
@@ -68,24 +59,25 @@ class ResultFormatter:
         results: list[RuleResult],
     ) -> list[str]:
         """Extract improvement areas from low-scoring criteria."""
-        improvements = []
-
-        for result in results:
-            criterion = get_criterion_by_id(result.criterion_id)
-            if not criterion or criterion.max_points == 0:
-                continue
-
-            percentage = result.score / criterion.max_points
-
-            if percentage < self.IMPROVEMENT_THRESHOLD:
-                if result.coaching:
-                    improvement_text = f"{criterion.criterion_name}: {result.coaching}"
-                else:
-                    improvement_text = f"{criterion.criterion_name}: Needs improvement - scored {result.score}/{criterion.max_points}"
-                improvements.append(improvement_text)
-
+        improvements = [
+            self._improvement_text(criterion, result)
+            for result in results
+            if (criterion := get_criterion_by_id(result.criterion_id))
+            and criterion.max_points
+            and result.score / criterion.max_points < self.IMPROVEMENT_THRESHOLD
+        ]
         return improvements[:5]
 
+    @staticmethod
+    def _improvement_text(criterion: TemplateCriterion, result: RuleResult) -> str:
+        """Describe an improvement area, preferring the result's coaching."""
+        if result.coaching:
+            return f"{criterion.criterion_name}: {result.coaching}"
+        return (
+            f"{criterion.criterion_name}: Needs improvement - "
+            f"scored {result.score}/{criterion.max_points}"
+        )
+
     def get_coaching_recommendations(
         self,
         results: list[RuleResult],
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Literal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemplateCriterion:
     """Definition of a scoring criterion within the onsite support template."""
 
@@ -72,10 +72,13 @@ _CRITERIA_BY_ID: dict[str, TemplateCriterion] = {
     c.criterion_id: c for c in ONSITE_REVIEW_CRITERIA
 }
 
+# Template total, fixed at import since the criteria never change
+_MAX_SCORE: int = sum(c.max_points for c in ONSITE_REVIEW_CRITERIA)
+
 
 def get_max_score() -> int:
     """Get maximum possible score (90 points)."""
-    return sum(c.max_points for c in ONSITE_REVIEW_CRITERIA)
+    return _MAX_SCORE
 
 
 def get_criteria() -> list[TemplateCriterion]:
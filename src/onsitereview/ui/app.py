@@ -22,6 +22,11 @@ from onsitereview.ui.state import (
     update_state,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -327,7 +332,7 @@ def run_evaluation() -> None:
             pct = progress.completed / progress.total if progress.total > 0 else 0
             progress_bar.progress(pct, text=f"Processing {progress.completed}/{progress.total}")
 
-            status_text.info(f"🎫 Current: **{progress.current_ticket or 'Starting...'}**")
+            status_text.info(f"🎫 Last completed: **{progress.current_ticket or 'Starting...'}**")
 
             with metrics_container.container():
                 col1, col2, col3 = st.columns(3)
@@ -409,7 +414,10 @@ def load_sample_data() -> None:
 
 
 def export_results_json(results: list) -> str:
-    """Export results as JSON string."""
+    """Export results as JSON string.
+
+    Uses orjson when installed, otherwise the standard library json.
+    """
     export_data = {
         "exported_at": datetime.now().isoformat(),
         "total_tickets": len(results),
@@ -441,6 +449,8 @@ def export_results_json(results: list) -> str:
             for r in results
         ],
     }
+    if orjson:
+        return orjson.dumps(export_data, option=orjson.OPT_INDENT_2).decode()
     return json.dumps(export_data, indent=2)
 
 
@@ -50,9 +50,9 @@ def render_progress_section() -> None:
         else:
             st.metric("Remaining", "Calculating...")
 
-    # Current ticket
+    # Most recently finished ticket
     if progress.current_ticket:
-        st.info(f"🎫 Processing: **{progress.current_ticket}**")
+        st.info(f"🎫 Last completed: **{progress.current_ticket}**")
 
     # Error count
     if progress.errors > 0:
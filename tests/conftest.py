@@ -1,32 +1,270 @@
 """Pytest fixtures for onsitereview tests."""
 
+from collections.abc import Callable, Iterator
+from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
-from onsitereview.models import ServiceNowTicket
+from onsitereview.models import CriterionScore, ServiceNowTicket
 from onsitereview.parser import ServiceNowParser
+from onsitereview.rules import OpenedForValidator, RuleResult, RulesEvaluator
 
+# (criterion_id, criterion_name, max_points, points_awarded, evidence, reasoning, coaching)
+_CRITERIA_SPEC = (
+    ("correct_category", "Category", 5, 5, "Correct", "Category matches incident", None),
+    (
+        "incident_notes",
+        "Incident Notes",
+        20,
+        18,
+        "Detailed",
+        "Missing one element",
+        "Include error messages",
+    ),
+)
 
-@pytest.fixture
+
+# (criterion_id, points, evidence, reasoning) - perfect scores for the VDI sample
+_PERFECT_RULE_SPEC = (
+    ("opened_for_correct", 10, "Opened For: colleague123", "Opened For field is populated"),
+)
+_PERFECT_LLM_SPEC = (
+    ("correct_category", 5, "Category: software", "Correct category for VDI issue"),
+    ("correct_subcategory", 5, "Subcategory: reset_restart", "Correct subcategory"),
+    ("correct_service", 5, "Service: VDI Service", "Correct service identified"),
+    ("correct_ci", 10, "CI: VDI-NCL-001", "Correct CI identified"),
+    (
+        "incident_notes",
+        20,
+        "Comprehensive notes with contact info and troubleshooting",
+        "All required elements present",
+    ),
+    ("incident_handling", 15, "Resolved at first contact", "Correct handling procedure"),
+    (
+        "resolution_notes",
+        20,
+        "VDI reset, colleague confirmed working",
+        "Complete resolution with colleague confirmation",
+    ),
+)
+
+
+def _perfect_results(spec: tuple[tuple[str, int, str, str], ...]) -> tuple[RuleResult, ...]:
+    """Build full-marks RuleResults from a perfect-score spec."""
+    return tuple(
+        RuleResult(
+            criterion_id=cid,
+            passed=True,
+            score=points,
+            max_score=points,
+            evidence=evidence,
+            reasoning=reasoning,
+        )
+        for cid, points, evidence, reasoning in spec
+    )
+
+
+class _StubLLM:
+    """Minimal LLMEvaluator stand-in; far cheaper than a MagicMock.
+
+    ``evaluate_ticket`` returns ``return_value``, or, when ``side_effect`` is
+    an iterator, its next item (raised if it is an exception).
+    """
+
+    def __init__(
+        self,
+        return_value: list[RuleResult],
+        side_effect: Iterator[list[RuleResult] | Exception] | None = None,
+    ) -> None:
+        self.return_value = return_value
+        self.side_effect = side_effect
+
+    def evaluate_ticket(self, ticket: ServiceNowTicket) -> list[RuleResult]:
+        if self.side_effect is None:
+            return self.return_value
+        result = next(self.side_effect)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Run benchmarks untimed unless ``--benchmark-only``/``--benchmark-enable`` is given.
+
+    Options are only present when pytest-benchmark is installed.
+    """
+    if hasattr(config.option, "benchmark_disable") and not config.option.benchmark_only:
+        config.option.benchmark_disable = True
+
+
+@pytest.fixture(scope="session")
 def project_root() -> Path:
     """Get project root directory."""
     return Path(__file__).parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tickets_path(project_root: Path) -> Path:
     """Path to prototype sample tickets JSON."""
     return project_root / "prototype_samples.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_tickets_bytes(sample_tickets_path: Path) -> bytes:
+    """Raw prototype sample JSON, read from disk once per session."""
+    return sample_tickets_path.read_bytes()
+
+
+@pytest.fixture(scope="session")
 def parser() -> ServiceNowParser:
     """ServiceNow parser instance."""
     return ServiceNowParser()
 
 
-@pytest.fixture
-def sample_tickets(parser: ServiceNowParser, sample_tickets_path: Path) -> list[ServiceNowTicket]:
-    """Parse and return sample tickets."""
-    return parser.parse_file(sample_tickets_path)
+@pytest.fixture(scope="session")
+def opened_for_validator() -> OpenedForValidator:
+    """Shared Opened For validator (stateless)."""
+    return OpenedForValidator()
+
+
+@pytest.fixture(scope="session")
+def rules_evaluator() -> RulesEvaluator:
+    """Shared rules evaluator (stateless)."""
+    return RulesEvaluator()
+
+
+@pytest.fixture(scope="session")
+def sample_tickets(
+    parser: ServiceNowParser, sample_tickets_bytes: bytes
+) -> tuple[ServiceNowTicket, ...]:
+    """Parse sample tickets once per session (read-only)."""
+    return tuple(parser.parse_bytes(sample_tickets_bytes))
+
+
+@pytest.fixture(scope="session")
+def sample_tickets_by_number(
+    sample_tickets: tuple[ServiceNowTicket, ...],
+) -> dict[str, ServiceNowTicket]:
+    """Sample tickets keyed by ticket number."""
+    return {t.number: t for t in sample_tickets}
+
+
+@pytest.fixture(scope="session")
+def ticket_index(sample_tickets: tuple[ServiceNowTicket, ...]) -> SimpleNamespace:
+    """Distinct field values across the sample tickets, computed once."""
+    return SimpleNamespace(
+        numbers=frozenset(t.number for t in sample_tickets),
+        categories=frozenset(t.category for t in sample_tickets),
+        subcategories=frozenset(t.subcategory for t in sample_tickets),
+        priorities=frozenset(t.priority for t in sample_tickets),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_ticket() -> ServiceNowTicket:
+    """VDI incident ticket shared by the scoring and LLM tests (read-only)."""
+    return ServiceNowTicket(
+        number="INC1234567",
+        sys_id="abc123",
+        opened_at=datetime(2025, 12, 10, 4, 26, 0),
+        resolved_at=datetime(2025, 12, 10, 4, 41, 0),
+        closed_at=datetime(2025, 12, 15, 5, 0, 0),
+        caller_id="caller123",
+        opened_by="agent123",
+        opened_for="user456",
+        assigned_to="agent123",
+        resolved_by="agent123",
+        closed_by="agent123",
+        short_description="MMC-NCL Bangalore-VDI-error message",
+        description=(
+            "Validated by: Okta Push MFA & Full Name\n\n"
+            "Contact Number: 1234567890\n"
+            "Working remotely: Y\n\n"
+            "Issue/Request: Colleague is getting error message while connecting to VDI\n\n"
+            "TS:\n"
+            "->VDI reset/restart\n"
+            "->asked colleague to login after 5-10 mins\n"
+            "->Colleague confirmed that they can login now\n"
+            "Got confirmation to close the ticket"
+        ),
+        close_notes=(
+            ">VDI reset/restart\n"
+            "->asked colleague to login after 5-10 mins\n"
+            "->Colleague confirmed that they can login now\n"
+            "Got confirmation to close the ticket"
+        ),
+        category="software",
+        subcategory="reset_restart",
+        business_service="VDI Service",
+        cmdb_ci="VDI Pool - Bangalore",
+        contact_type="phone",
+        state="7",
+        incident_state="7",
+        priority="5",
+        impact="3",
+        urgency="3",
+        company="company123",
+        location="location123",
+        assignment_group="group123",
+    )
+
+
+@pytest.fixture(scope="session")
+def make_sample_ticket(
+    sample_ticket: ServiceNowTicket,
+) -> Callable[..., ServiceNowTicket]:
+    """Build variants of ``sample_ticket`` by overriding fields.
+
+    Overrides are applied with ``model_copy`` and are not re-validated,
+    so pass already-typed values.
+    """
+
+    def make(**overrides) -> ServiceNowTicket:
+        return sample_ticket.model_copy(update=overrides)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def sample_criteria() -> tuple[CriterionScore, ...]:
+    """Criterion scores shared by the evaluation model tests."""
+    return tuple(
+        CriterionScore(
+            criterion_id=cid,
+            criterion_name=name,
+            max_points=max_points,
+            points_awarded=awarded,
+            evidence=evidence,
+            reasoning=reasoning,
+            coaching=coaching,
+        )
+        for cid, name, max_points, awarded, evidence, reasoning, coaching in _CRITERIA_SPEC
+    )
+
+
+@pytest.fixture(scope="session")
+def rule_results() -> tuple[RuleResult, ...]:
+    """Perfect rule results (read-only)."""
+    return _perfect_results(_PERFECT_RULE_SPEC)
+
+
+@pytest.fixture(scope="session")
+def llm_results() -> tuple[RuleResult, ...]:
+    """Perfect LLM results (read-only)."""
+    return _perfect_results(_PERFECT_LLM_SPEC)
+
+
+@pytest.fixture(scope="session")
+def all_results(
+    rule_results: tuple[RuleResult, ...], llm_results: tuple[RuleResult, ...]
+) -> tuple[RuleResult, ...]:
+    """Rule and LLM results combined, as TicketEvaluator passes them on."""
+    return rule_results + llm_results
+
+
+@pytest.fixture(scope="session")
+def make_stub_llm() -> type[_StubLLM]:
+    """Build LLMEvaluator stand-ins: ``make_stub_llm(return_value, side_effect=None)``."""
+    return _StubLLM
@@ -0,0 +1,85 @@
+"""Benchmarks for the scoring and batch hot paths (requires pytest-benchmark).
+
+Timed only with ``pytest tests/test_benchmarks.py --benchmark-only`` (or
+``--benchmark-enable``); plain runs and pytest-xdist runs execute each
+benchmark once, untimed.
+"""
+
+from collections.abc import Callable
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from onsitereview.models.evaluation import EvaluationResult, TemplateType  # noqa: E402
+from onsitereview.models.ticket import ServiceNowTicket  # noqa: E402
+from onsitereview.rules.base import RuleResult  # noqa: E402
+from onsitereview.scoring import (  # noqa: E402
+    BatchTicketEvaluator,
+    ScoringCalculator,
+    TicketEvaluator,
+)
+
+
+@pytest.fixture(scope="module")
+def evaluator(make_stub_llm, llm_results: tuple[RuleResult, ...]) -> TicketEvaluator:
+    """Ticket evaluator whose LLM stub returns perfect results without API calls."""
+    return TicketEvaluator(llm_evaluator=make_stub_llm(list(llm_results)))
+
+
+@pytest.fixture(scope="module")
+def batch_evaluator(evaluator: TicketEvaluator) -> BatchTicketEvaluator:
+    """Batch evaluator sharing the module's ticket evaluator."""
+    return BatchTicketEvaluator(evaluator)
+
+
+@pytest.fixture(scope="module", params=[10, 100, 1000], ids=lambda n: f"{n}-tickets")
+def tickets(
+    request: pytest.FixtureRequest,
+    make_sample_ticket: Callable[..., ServiceNowTicket],
+) -> list[ServiceNowTicket]:
+    """Distinct tickets per batch size, built outside the timed region."""
+    return [make_sample_ticket(number=f"INC{i:07d}") for i in range(request.param)]
+
+
+@pytest.fixture(scope="module")
+def evaluation_results(tickets: list[ServiceNowTicket]) -> list[EvaluationResult]:
+    """One evaluation per ticket, cycling through every band."""
+    return [
+        EvaluationResult(
+            ticket_number=ticket.number,
+            template=TemplateType.ONSITE_REVIEW,
+            total_score=score,
+            criterion_scores=[],
+            strengths=[],
+            improvements=["Category: Use software category", "Incident Notes: Add detail"],
+        )
+        for ticket, score in zip(tickets, [90, 82, 70, 50, 30] * len(tickets), strict=False)
+    ]
+
+
+def test_calculate_score(benchmark, rule_results, llm_results):
+    calculator = ScoringCalculator()
+
+    result = benchmark(calculator.calculate_score, list(rule_results), list(llm_results))
+
+    assert result.total_score == 90
+
+
+def test_evaluate_ticket(benchmark, evaluator, sample_ticket):
+    result = benchmark(evaluator.evaluate_ticket, sample_ticket)
+
+    assert result.total_score == 90
+
+
+def test_evaluate_batch(benchmark, batch_evaluator, tickets):
+    result = benchmark(batch_evaluator.evaluate_batch, tickets)
+
+    assert len(result.results) == len(tickets)
+    assert not result.errors
+
+
+def test_generate_summary(benchmark, batch_evaluator, evaluation_results):
+    summary = benchmark(batch_evaluator.generate_summary, evaluation_results)
+
+    assert summary.total_tickets == len(evaluation_results)
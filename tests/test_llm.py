@@ -1,6 +1,7 @@
 """Tests for LLM evaluation module - Onsite Support Review."""
 
 import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,7 +11,6 @@ from onsitereview.llm import (
     BatchProgress,
     LLMAPIError,
     LLMEvaluator,
-    LLMRateLimitError,
     LLMValidationError,
     OpenAIClient,
     TokenUsage,
@@ -27,62 +27,21 @@ from onsitereview.llm.schemas import (
     IncidentNotesEvaluation,
     ResolutionNotesEvaluation,
 )
-from onsitereview.models.ticket import ServiceNowTicket
 
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
+# Token usage reported by each mocked completion
+_USAGE = SimpleNamespace(prompt_tokens=100, completion_tokens=50, total_tokens=150)
 
-@pytest.fixture
-def sample_ticket() -> ServiceNowTicket:
-    """Create a sample ticket for testing."""
-    from datetime import datetime
-
-    return ServiceNowTicket(
-        number="INC1234567",
-        sys_id="abc123",
-        opened_at=datetime(2025, 12, 10, 4, 26, 0),
-        resolved_at=datetime(2025, 12, 10, 4, 41, 0),
-        closed_at=datetime(2025, 12, 15, 5, 0, 0),
-        caller_id="caller123",
-        opened_by="agent123",
-        opened_for="user456",
-        assigned_to="agent123",
-        resolved_by="agent123",
-        closed_by="agent123",
-        short_description="MMC-NCL Bangalore-VDI-error message",
-        description=(
-            "Validated by: Okta Push MFA & Full Name\n\n"
-            "Contact Number: 1234567890\n"
-            "Working remotely: Y\n\n"
-            "Issue/Request: Colleague is getting error message while connecting to VDI\n\n"
-            "TS:\n"
-            "->VDI reset/restart\n"
-            "->asked colleague to login after 5-10 mins\n"
-            "->Colleague confirmed that they can login now\n"
-            "Got confirmation to close the ticket"
-        ),
-        close_notes=(
-            ">VDI reset/restart\n"
-            "->asked colleague to login after 5-10 mins\n"
-            "->Colleague confirmed that they can login now\n"
-            "Got confirmation to close the ticket"
-        ),
-        category="software",
-        subcategory="reset_restart",
-        business_service="VDI Service",
-        cmdb_ci="VDI Pool - Bangalore",
-        contact_type="phone",
-        state="7",
-        incident_state="7",
-        priority="5",
-        impact="3",
-        urgency="3",
-        company="company123",
-        location="location123",
-        assignment_group="group123",
+
+def _completion(content: str | None, usage: SimpleNamespace | None = _USAGE) -> SimpleNamespace:
+    """Build a chat completion response shaped like the OpenAI SDK's."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=usage,
     )
 
 
@@ -229,16 +188,8 @@ class TestOpenAIClient:
 
     @patch("onsitereview.llm.client.OpenAI")
     def test_complete_success(self, mock_openai_class):
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"result": "success"}'
-        mock_response.usage = MagicMock()
-        mock_response.usage.prompt_tokens = 100
-        mock_response.usage.completion_tokens = 50
-        mock_response.usage.total_tokens = 150
-
         mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _completion('{"result": "success"}')
         mock_openai_class.return_value = mock_client
 
         client = OpenAIClient(api_key="test-key")
@@ -249,13 +200,8 @@ class TestOpenAIClient:
 
     @patch("onsitereview.llm.client.OpenAI")
     def test_complete_invalid_json(self, mock_openai_class):
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "not valid json"
-        mock_response.usage = None
-
         mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _completion("not valid json", usage=None)
         mock_openai_class.return_value = mock_client
 
         client = OpenAIClient(api_key="test-key")
@@ -265,13 +211,8 @@ class TestOpenAIClient:
 
     @patch("onsitereview.llm.client.OpenAI")
     def test_complete_empty_response(self, mock_openai_class):
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = None
-        mock_response.usage = None
-
         mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _completion(None, usage=None)
         mock_openai_class.return_value = mock_client
 
         client = OpenAIClient(api_key="test-key")
@@ -604,20 +545,9 @@ class TestIntegration:
             json.dumps(mock_incident_handling_response),
             json.dumps(mock_resolution_notes_response),
         ]
-        response_iter = iter(responses)
-
-        def make_response(*args, **kwargs):
-            mock_resp = MagicMock()
-            mock_resp.choices = [MagicMock()]
-            mock_resp.choices[0].message.content = next(response_iter)
-            mock_resp.usage = MagicMock()
-            mock_resp.usage.prompt_tokens = 100
-            mock_resp.usage.completion_tokens = 50
-            mock_resp.usage.total_tokens = 150
-            return mock_resp
 
         mock_client = MagicMock()
-        mock_client.chat.completions.create.side_effect = make_response
+        mock_client.chat.completions.create.side_effect = [_completion(r) for r in responses]
         mock_openai_class.return_value = mock_client
 
         client = OpenAIClient(api_key="test-key")
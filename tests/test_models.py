@@ -1,7 +1,5 @@
 """Tests for onsitereview data models."""
 
-from datetime import datetime
-
 import pytest
 from pydantic import ValidationError
 
@@ -14,6 +12,16 @@ from onsitereview.models import (
     TemplateType,
 )
 
+pytestmark = pytest.mark.filterwarnings("error::DeprecationWarning")
+
+# Common EvaluationResult kwargs shared by the evaluation tests
+BASE_EVAL = {
+    "ticket_number": "INC123",
+    "template": TemplateType.ONSITE_REVIEW,
+    "strengths": [],
+    "improvements": [],
+}
+
 
 class TestPerformanceBand:
     """Tests for PerformanceBand enum."""
@@ -43,11 +51,9 @@ class TestPerformanceBand:
         assert PerformanceBand.BLUE.display_name == "Blue"
         assert PerformanceBand.GREEN.display_name == "Green"
 
-    def test_css_color(self):
-        for band in PerformanceBand:
-            color = band.css_color
-            assert color.startswith("#")
-            assert len(color) == 7
+    def test_css_colors_are_valid_hex(self):
+        colors = {band: band.css_color for band in PerformanceBand}
+        assert all(c.startswith("#") and len(c) == 7 for c in colors.values())
 
 
 class TestCriterionScore:
@@ -103,86 +109,53 @@ class TestCriterionScore:
 class TestEvaluationResult:
     """Tests for EvaluationResult model."""
 
-    @pytest.fixture
-    def sample_criteria(self) -> list[CriterionScore]:
-        return [
-            CriterionScore(
-                criterion_id="correct_category",
-                criterion_name="Category",
-                max_points=5,
-                points_awarded=5,
-                evidence="Correct",
-                reasoning="Category matches incident",
-            ),
-            CriterionScore(
-                criterion_id="incident_notes",
-                criterion_name="Incident Notes",
-                max_points=20,
-                points_awarded=18,
-                evidence="Detailed",
-                reasoning="Missing one element",
-                coaching="Include error messages",
-            ),
-        ]
-
     def test_create_passing_evaluation(self, sample_criteria):
         result = EvaluationResult(
-            ticket_number="INC123",
-            template=TemplateType.ONSITE_REVIEW,
+            **{
+                **BASE_EVAL,
+                "strengths": ["Good documentation"],
+                "improvements": ["Add more detail"],
+            },
             total_score=83,
             criterion_scores=sample_criteria,
-            strengths=["Good documentation"],
-            improvements=["Add more detail"],
         )
         assert result.passed is True
-        assert result.percentage == pytest.approx(92.2, 0.1)
+        assert result.percentage == 92.2  # round(83 / 90 * 100, 1)
         assert result.band == PerformanceBand.GREEN
 
     def test_create_failing_evaluation(self, sample_criteria):
         result = EvaluationResult(
-            ticket_number="INC123",
-            template=TemplateType.ONSITE_REVIEW,
+            **{**BASE_EVAL, "improvements": ["Improve documentation"]},
             total_score=70,
             criterion_scores=sample_criteria,
-            strengths=[],
-            improvements=["Improve documentation"],
         )
         assert result.passed is False
-        assert result.percentage == pytest.approx(77.8, 0.1)
+        assert result.percentage == 77.8  # round(70 / 90 * 100, 1)
         assert result.band == PerformanceBand.YELLOW
 
     def test_pass_threshold(self, sample_criteria):
         """Pass threshold should be 81 (90% of 90)."""
         result = EvaluationResult(
-            ticket_number="INC123",
-            template=TemplateType.ONSITE_REVIEW,
+            **BASE_EVAL,
             total_score=81,
             criterion_scores=sample_criteria,
-            strengths=[],
-            improvements=[],
         )
         assert result.pass_threshold == 81
         assert result.passed is True
 
     def test_points_to_pass(self, sample_criteria):
         result = EvaluationResult(
-            ticket_number="INC123",
-            template=TemplateType.ONSITE_REVIEW,
+            **BASE_EVAL,
             total_score=75,
             criterion_scores=sample_criteria,
-            strengths=[],
-            improvements=[],
         )
         assert result.points_to_pass == 6  # 81 - 75
 
     def test_get_criterion_by_id(self, sample_criteria):
         result = EvaluationResult(
-            ticket_number="INC123",
-            template=TemplateType.ONSITE_REVIEW,
+            **BASE_EVAL,
             total_score=83,
             criterion_scores=sample_criteria,
-            strengths=[],
-            improvements=[],
         )
         crit = result.get_criterion_by_id("correct_category")
         assert crit is not None
@@ -195,68 +168,72 @@ class TestEvaluationResult:
 class TestBatchEvaluationSummary:
     """Tests for BatchEvaluationSummary model."""
 
-    def test_pass_rate_calculation(self):
-        summary = BatchEvaluationSummary(
-            total_tickets=100,
-            passed_count=85,
-            failed_count=15,
-            average_score=78.0,
-            average_percentage=86.7,
-        )
-        assert summary.pass_rate == 85.0
-
-    def test_pass_rate_zero_tickets(self):
+    @pytest.mark.parametrize(
+        "total,passed,failed,expected_rate",
+        [
+            (100, 85, 15, 85.0),
+            (0, 0, 0, 0.0),  # Zero tickets
+        ],
+    )
+    def test_pass_rate(self, total, passed, failed, expected_rate):
         summary = BatchEvaluationSummary(
-            total_tickets=0,
-            passed_count=0,
-            failed_count=0,
+            total_tickets=total,
+            passed_count=passed,
+            failed_count=failed,
             average_score=0,
             average_percentage=0,
         )
-        assert summary.pass_rate == 0.0
+        assert summary.pass_rate == expected_rate
 
 
 class TestAnalystReview:
     """Tests for AnalystReview model."""
 
-    def _make_eval(self, score: int) -> EvaluationResult:
-        return EvaluationResult(
-            ticket_number=f"INC{score}",
-            template=TemplateType.ONSITE_REVIEW,
-            total_score=score,
-            criterion_scores=[],
-            strengths=[],
-            improvements=[],
-        )
-
-    def test_average_percentage(self):
+    @pytest.fixture(scope="module")
+    def eval_by_score(self) -> dict[int, EvaluationResult]:
+        """One validated evaluation per score used by the review cases."""
+        return {
+            score: EvaluationResult(
+                ticket_number=f"INC{score}",
+                template=TemplateType.ONSITE_REVIEW,
+                total_score=score,
+                criterion_scores=[],
+                strengths=[],
+                improvements=[],
+            )
+            for score in (50, 60, 70, 72, 81, 90)
+        }
+
+    @pytest.fixture(
+        scope="module",
+        params=[
+            # (90.0 + 100.0 + 80.0) / 3 = 90.0
+            ((81, 90, 72), 90.0, True, PerformanceBand.GREEN),
+            # (66.7 + 77.8 + 55.6) / 3 = 66.7
+            ((60, 70, 50), 66.7, False, PerformanceBand.RED),
+            ((90, 90, 90), 100.0, True, PerformanceBand.BLUE),
+        ],
+        ids=["at-threshold", "below-threshold", "perfect"],
+    )
+    def review_case(self, request, eval_by_score):
+        scores, average, passed, band = request.param
         review = AnalystReview(
             analyst_id="analyst1",
-            evaluations=[self._make_eval(81), self._make_eval(90), self._make_eval(72)],
+            evaluations=[eval_by_score[s] for s in scores],
         )
-        # (90.0 + 100.0 + 80.0) / 3 = 90.0
-        assert review.average_percentage == 90.0
+        return review, average, passed, band
 
-    def test_passed_when_average_meets_threshold(self):
-        review = AnalystReview(
-            analyst_id="analyst1",
-            evaluations=[self._make_eval(81), self._make_eval(90), self._make_eval(72)],
-        )
-        assert review.passed is True
+    def test_average_percentage(self, review_case):
+        review, average, _, _ = review_case
+        assert review.average_percentage == average
 
-    def test_failed_when_average_below_threshold(self):
-        review = AnalystReview(
-            analyst_id="analyst1",
-            evaluations=[self._make_eval(60), self._make_eval(70), self._make_eval(50)],
-        )
-        assert review.passed is False
+    def test_passed(self, review_case):
+        review, _, passed, _ = review_case
+        assert review.passed is passed
 
-    def test_band_assignment(self):
-        review = AnalystReview(
-            analyst_id="analyst1",
-            evaluations=[self._make_eval(90), self._make_eval(90), self._make_eval(90)],
-        )
-        assert review.band == PerformanceBand.BLUE
+    def test_band_assignment(self, review_case):
+        review, _, _, band = review_case
+        assert review.band == band
 
     def test_empty_evaluations(self):
         review = AnalystReview(
@@ -283,22 +260,16 @@ class TestModelValidation:
     def test_evaluation_result_score_bounds(self):
         with pytest.raises(ValidationError):
             EvaluationResult(
-                ticket_number="INC123",
-                template=TemplateType.ONSITE_REVIEW,
+                **BASE_EVAL,
                 total_score=91,  # Over max
                 criterion_scores=[],
-                strengths=[],
-                improvements=[],
             )
 
         with pytest.raises(ValidationError):
             EvaluationResult(
-                ticket_number="INC123",
-                template=TemplateType.ONSITE_REVIEW,
+                **BASE_EVAL,
                 total_score=-1,  # Under min
                 criterion_scores=[],
-                strengths=[],
-                improvements=[],
             )
 
     def test_criterion_score_requires_fields(self):
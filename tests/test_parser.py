@@ -2,12 +2,25 @@
 
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 from onsitereview.models import ServiceNowTicket
+from onsitereview.models.ticket import lob_from_short_description
 from onsitereview.parser import ServiceNowParser
 
+# Prototype sample ticket numbers; the tickets themselves are parsed at setup
+SAMPLE_TICKET_NUMBERS = ("INC8924218", "INC8924339", "INC8923651")
+
+
+@pytest.fixture(params=SAMPLE_TICKET_NUMBERS)
+def ticket(
+    request: pytest.FixtureRequest, sample_tickets_by_number: dict[str, ServiceNowTicket]
+) -> ServiceNowTicket:
+    """Each sample ticket in turn, so per-ticket tests run once per ticket."""
+    return sample_tickets_by_number[request.param]
+
 
 class TestServiceNowParser:
     """Tests for ServiceNowParser class."""
@@ -35,67 +48,60 @@ class TestServiceNowParser:
 class TestTicketParsing:
     """Tests for individual ticket parsing."""
 
-    def test_ticket_numbers(self, sample_tickets: list[ServiceNowTicket]):
+    def test_ticket_numbers(self, ticket_index: SimpleNamespace):
         """All ticket numbers should be parsed correctly."""
-        numbers = {t.number for t in sample_tickets}
-        assert numbers == {"INC8924218", "INC8924339", "INC8923651"}
+        assert ticket_index.numbers == {"INC8924218", "INC8924339", "INC8923651"}
 
-    def test_ticket_sys_ids(self, sample_tickets: list[ServiceNowTicket]):
+    def test_ticket_sys_ids(self, ticket: ServiceNowTicket):
         """All tickets should have sys_id populated."""
-        for ticket in sample_tickets:
-            assert ticket.sys_id
-            assert len(ticket.sys_id) == 32  # ServiceNow sys_id length
+        assert ticket.sys_id
+        assert len(ticket.sys_id) == 32  # ServiceNow sys_id length
 
-    def test_opened_at_parsing(self, sample_tickets: list[ServiceNowTicket]):
+    def test_opened_at_parsing(self, ticket: ServiceNowTicket):
         """Opened timestamps should be parsed correctly."""
-        for ticket in sample_tickets:
-            assert ticket.opened_at is not None
-            assert isinstance(ticket.opened_at, datetime)
-            assert ticket.opened_at.year == 2025
-            assert ticket.opened_at.month == 12
-            assert ticket.opened_at.day == 10
-
-    def test_resolved_at_parsing(self, sample_tickets: list[ServiceNowTicket]):
+        assert ticket.opened_at is not None
+        assert isinstance(ticket.opened_at, datetime)
+        assert ticket.opened_at.year == 2025
+        assert ticket.opened_at.month == 12
+        assert ticket.opened_at.day == 10
+
+    def test_resolved_at_parsing(self, ticket: ServiceNowTicket):
         """Resolved timestamps should be parsed correctly."""
-        for ticket in sample_tickets:
-            assert ticket.resolved_at is not None
-            assert isinstance(ticket.resolved_at, datetime)
+        assert ticket.resolved_at is not None
+        assert isinstance(ticket.resolved_at, datetime)
 
-    def test_closed_at_parsing(self, sample_tickets: list[ServiceNowTicket]):
+    def test_closed_at_parsing(self, ticket: ServiceNowTicket):
         """Closed timestamps should be parsed correctly."""
-        for ticket in sample_tickets:
-            assert ticket.closed_at is not None
-            assert ticket.closed_at >= ticket.resolved_at
+        assert ticket.closed_at is not None
+        assert ticket.closed_at >= ticket.resolved_at
 
-    def test_resolution_time_calculated(self, sample_tickets: list[ServiceNowTicket]):
+    def test_resolution_time_calculated(self, ticket: ServiceNowTicket):
         """Resolution time should be computed from timestamps."""
-        for ticket in sample_tickets:
-            assert ticket.resolution_time_minutes is not None
-            assert ticket.resolution_time_minutes > 0
+        assert ticket.resolution_time_minutes is not None
+        assert ticket.resolution_time_minutes > 0
 
-    def test_resolution_time_accuracy(self, sample_tickets: list[ServiceNowTicket]):
+    def test_resolution_time_accuracy(self, sample_tickets_by_number: dict[str, ServiceNowTicket]):
         """Resolution time should match expected values."""
         # INC8924218: opened 04:26:00, resolved 04:41:00 = 15 minutes
-        inc1 = next(t for t in sample_tickets if t.number == "INC8924218")
+        inc1 = sample_tickets_by_number["INC8924218"]
         assert inc1.resolution_time_minutes == 15
 
         # INC8924339: opened 04:57:00, resolved 04:59:00 = 2 minutes
-        inc2 = next(t for t in sample_tickets if t.number == "INC8924339")
+        inc2 = sample_tickets_by_number["INC8924339"]
         assert inc2.resolution_time_minutes == 2
 
 
 class TestBooleanParsing:
     """Tests for boolean field parsing."""
 
-    def test_lob_flags_parsed(self, sample_tickets: list[ServiceNowTicket]):
+    def test_lob_flags_parsed(self, ticket: ServiceNowTicket):
         """LoB boolean flags should parse correctly."""
-        for ticket in sample_tickets:
-            # All sample tickets have all LoB flags as false
-            assert ticket.u_marsh is False
-            assert ticket.u_mercer is False
-            assert ticket.u_guy_carpenter is False
-            assert ticket.u_oliver_wyman_group is False
-            assert ticket.u_mmc_corporate is False
+        # All sample tickets have all LoB flags as false
+        assert ticket.u_marsh is False
+        assert ticket.u_mercer is False
+        assert ticket.u_guy_carpenter is False
+        assert ticket.u_oliver_wyman_group is False
+        assert ticket.u_mmc_corporate is False
 
     def test_parse_bool_true(self, parser: ServiceNowParser):
         """Parser should convert 'true' string to True."""
@@ -118,99 +124,110 @@ class TestBooleanParsing:
 class TestLineOfBusinessExtraction:
     """Tests for LoB extraction logic."""
 
-    def test_lob_from_short_description(self, sample_tickets: list[ServiceNowTicket]):
+    @pytest.mark.parametrize(
+        "number,expected_lob",
+        [
+            ("INC8924218", "MMC Corporate"),  # "MMC-NCL Bangalore-VDI-error message"
+            ("INC8924339", "Marsh"),  # "Marsh-Mumbai-LAN-Need password reset"
+            ("INC8923651", "MMC Corporate"),  # "MMC - Wollongong - AD - Password reset"
+        ],
+    )
+    def test_lob_from_short_description(
+        self,
+        sample_tickets_by_number: dict[str, ServiceNowTicket],
+        number: str,
+        expected_lob: str,
+    ):
         """LoB should be extracted from short description prefix."""
-        # INC8924218: "MMC-NCL Bangalore-VDI-error message"
-        inc1 = next(t for t in sample_tickets if t.number == "INC8924218")
-        assert inc1.line_of_business == "MMC Corporate"
-
-        # INC8924339: "Marsh-Mumbai-LAN-Need password reset"
-        inc2 = next(t for t in sample_tickets if t.number == "INC8924339")
-        assert inc2.line_of_business == "Marsh"
-
-        # INC8923651: "MMC - Wollongong - AD - Password reset"
-        inc3 = next(t for t in sample_tickets if t.number == "INC8923651")
-        assert inc3.line_of_business == "MMC Corporate"
+        assert sample_tickets_by_number[number].line_of_business == expected_lob
+
+    @pytest.mark.parametrize(
+        "short_desc,expected_lob",
+        [
+            ("MARSH - Location - App - Brief", "Marsh"),
+            ("Mercer-Sydney-Outlook-Crash", "Mercer"),
+            ("GC - London - VPN - Timeout", "Guy Carpenter"),
+            ("Oliver Wyman - NYC - Teams - Audio", "Oliver Wyman"),
+            ("MMC-NCL Bangalore-VDI-error message", "MMC Corporate"),
+            ("Acme - Location - App - Brief", None),
+            ("Marsh password reset", None),  # No separator
+        ],
+    )
+    def test_lob_prefix_patterns(
+        self, parser: ServiceNowParser, short_desc: str, expected_lob: str | None
+    ):
+        """Known LoB prefixes should map to their canonical names."""
+        raw = {"short_description": short_desc}
+        assert parser._extract_line_of_business(raw) == expected_lob
+        assert lob_from_short_description(short_desc) == expected_lob
 
-    def test_get_line_of_business_method(self, sample_tickets: list[ServiceNowTicket]):
+    def test_get_line_of_business_method(self, ticket: ServiceNowTicket):
         """Ticket method should return correct LoB."""
-        for ticket in sample_tickets:
-            lob = ticket.get_line_of_business()
-            assert lob in ["Marsh", "Mercer", "Guy Carpenter", "Oliver Wyman", "MMC Corporate"]
+        lob = ticket.get_line_of_business()
+        assert lob in ["Marsh", "Mercer", "Guy Carpenter", "Oliver Wyman", "MMC Corporate"]
 
 
 class TestTicketClassification:
     """Tests for ticket classification fields."""
 
-    def test_categories_parsed(self, sample_tickets: list[ServiceNowTicket]):
+    def test_categories_parsed(self, ticket_index: SimpleNamespace):
         """Categories should be parsed correctly."""
-        categories = {t.category for t in sample_tickets}
-        assert "software" in categories
-        assert "inquiry" in categories
+        assert "software" in ticket_index.categories
+        assert "inquiry" in ticket_index.categories
 
-    def test_subcategories_parsed(self, sample_tickets: list[ServiceNowTicket]):
+    def test_subcategories_parsed(self, ticket_index: SimpleNamespace):
         """Subcategories should be parsed correctly."""
-        subcategories = {t.subcategory for t in sample_tickets}
-        assert "reset_restart" in subcategories
-        assert "password reset" in subcategories
+        assert "reset_restart" in ticket_index.subcategories
+        assert "password reset" in ticket_index.subcategories
 
-    def test_contact_type_all_phone(self, sample_tickets: list[ServiceNowTicket]):
+    def test_contact_type_all_phone(self, ticket: ServiceNowTicket):
         """All sample tickets should have phone contact type."""
-        for ticket in sample_tickets:
-            assert ticket.contact_type == "phone"
+        assert ticket.contact_type == "phone"
 
-    def test_priority_parsed(self, sample_tickets: list[ServiceNowTicket]):
+    def test_priority_parsed(self, ticket_index: SimpleNamespace):
         """Priority should be parsed correctly."""
-        priorities = {t.priority for t in sample_tickets}
-        assert priorities.issubset({"4", "5"})
+        assert ticket_index.priorities <= {"4", "5"}
 
 
 class TestTicketContent:
     """Tests for ticket content fields."""
 
-    def test_short_description_populated(self, sample_tickets: list[ServiceNowTicket]):
+    def test_short_description_populated(self, ticket: ServiceNowTicket):
         """Short descriptions should be populated."""
-        for ticket in sample_tickets:
-            assert ticket.short_description
-            assert len(ticket.short_description) > 10
+        assert ticket.short_description
+        assert len(ticket.short_description) > 10
 
-    def test_description_populated(self, sample_tickets: list[ServiceNowTicket]):
+    def test_description_populated(self, ticket: ServiceNowTicket):
         """Full descriptions should be populated."""
-        for ticket in sample_tickets:
-            assert ticket.description
-            assert len(ticket.description) > 50
+        assert ticket.description
+        assert len(ticket.description) > 50
 
-    def test_close_notes_populated(self, sample_tickets: list[ServiceNowTicket]):
+    def test_close_notes_populated(self, ticket: ServiceNowTicket):
         """Close notes should be populated."""
-        for ticket in sample_tickets:
-            assert ticket.close_notes
-            assert len(ticket.close_notes) > 10
+        assert ticket.close_notes
+        assert len(ticket.close_notes) > 10
 
-    def test_close_code_populated(self, sample_tickets: list[ServiceNowTicket]):
+    def test_close_code_populated(self, ticket: ServiceNowTicket):
         """Close code should be 'Solved (Permanently)' for all samples."""
-        for ticket in sample_tickets:
-            assert ticket.close_code == "Solved (Permanently)"
+        assert ticket.close_code == "Solved (Permanently)"
 
 
 class TestTicketStatus:
     """Tests for ticket status properties."""
 
-    def test_is_closed(self, sample_tickets: list[ServiceNowTicket]):
+    def test_is_closed(self, ticket: ServiceNowTicket):
         """All sample tickets should be closed."""
-        for ticket in sample_tickets:
-            assert ticket.is_closed is True
-            assert ticket.state == "7"
-            assert ticket.incident_state == "7"
+        assert ticket.is_closed is True
+        assert ticket.state == "7"
+        assert ticket.incident_state == "7"
 
-    def test_is_resolved(self, sample_tickets: list[ServiceNowTicket]):
+    def test_is_resolved(self, ticket: ServiceNowTicket):
         """All sample tickets should be resolved."""
-        for ticket in sample_tickets:
-            assert ticket.is_resolved is True
+        assert ticket.is_resolved is True
 
-    def test_opened_for_parsed(self, sample_tickets: list[ServiceNowTicket]):
+    def test_opened_for_parsed(self, ticket: ServiceNowTicket):
         """Sample tickets should have opened_for field parsed."""
-        for ticket in sample_tickets:
-            assert isinstance(ticket.opened_for, str)
+        assert isinstance(ticket.opened_for, str)
 
 
 class TestDatetimeParsing:
@@ -231,6 +248,24 @@ class TestDatetimeParsing:
         assert parser._parse_datetime("not-a-date") is None
         assert parser._parse_datetime("2025/12/10") is None
 
+    def test_parse_out_of_range_datetime(self, parser: ServiceNowParser):
+        """Parser should reject well-shaped but impossible timestamps."""
+        assert parser._parse_datetime("2025-13-10 04:26:00") is None
+        assert parser._parse_datetime("2025-12-10 04:26:61") is None
+
+    @pytest.mark.parametrize(
+        "value",
+        ["2025-12-10 04:+5:00", "2025-12-10 04:-0:00", "2025-12-10 04: 5:00"],
+    )
+    def test_parse_signed_or_spaced_fields_rejected(self, parser: ServiceNowParser, value: str):
+        """Parser should reject signs and spaces inside numeric fields."""
+        assert parser._parse_datetime(value) is None
+
+    def test_parse_unpadded_datetime(self, parser: ServiceNowParser):
+        """Parser should still accept non zero-padded fields."""
+        result = parser._parse_datetime("2025-1-5 4:26:00")
+        assert result == datetime(2025, 1, 5, 4, 26, 0)
+
 
 class TestIntegerParsing:
     """Tests for integer parsing."""
@@ -249,14 +284,12 @@ class TestIntegerParsing:
         """Parser should pass through actual integers."""
         assert parser._parse_int(42) == 42
 
-    def test_reassignment_count(self, sample_tickets: list[ServiceNowTicket]):
+    def test_reassignment_count(self, ticket: ServiceNowTicket):
         """Reassignment count should be parsed as int."""
-        for ticket in sample_tickets:
-            assert isinstance(ticket.reassignment_count, int)
-            assert ticket.reassignment_count == 1  # All samples have 1
+        assert isinstance(ticket.reassignment_count, int)
+        assert ticket.reassignment_count == 1  # All samples have 1
 
-    def test_reopen_count(self, sample_tickets: list[ServiceNowTicket]):
+    def test_reopen_count(self, ticket: ServiceNowTicket):
         """Reopen count should be parsed as int."""
-        for ticket in sample_tickets:
-            assert isinstance(ticket.reopen_count, int)
-            assert ticket.reopen_count == 0  # All samples have 0
+        assert isinstance(ticket.reopen_count, int)
+        assert ticket.reopen_count == 0  # All samples have 0
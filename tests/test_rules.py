@@ -1,17 +1,14 @@
 """Tests for onsitereview rules engine."""
 
 from datetime import datetime
-
-import pytest
+from types import MappingProxyType
 
 from onsitereview.models.ticket import ServiceNowTicket
 from onsitereview.rules.evaluator import RulesEvaluator
 from onsitereview.rules.opened_for import OpenedForValidator
 
-
-def _make_ticket(**overrides) -> ServiceNowTicket:
-    """Create a test ticket with defaults."""
-    defaults = {
+_TICKET_DEFAULTS = MappingProxyType(
+    {
         "number": "INC0001",
         "sys_id": "abc123",
         "opened_at": datetime(2024, 1, 1),
@@ -33,37 +30,44 @@ def _make_ticket(**overrides) -> ServiceNowTicket:
         "location": "loc1",
         "assignment_group": "grp1",
     }
-    defaults.update(overrides)
-    return ServiceNowTicket(**defaults)
+)
+
+# Validated once; variants are cheap copies with overridden fields
+_PROTOTYPE_TICKET = ServiceNowTicket(**_TICKET_DEFAULTS)
+
+
+def _make_ticket(**overrides) -> ServiceNowTicket:
+    """Create a test ticket from the prototype with field overrides.
+
+    Overrides are not re-validated, so pass already-typed values.
+    """
+    return _PROTOTYPE_TICKET.model_copy(update=overrides)
 
 
 class TestOpenedForValidator:
     """Tests for OpenedForValidator."""
 
-    def setup_method(self):
-        self.validator = OpenedForValidator()
-
-    def test_passes_when_opened_for_populated(self):
+    def test_passes_when_opened_for_populated(self, opened_for_validator: OpenedForValidator):
         ticket = _make_ticket(opened_for="user_sys_id_123")
-        result = self.validator.evaluate(ticket)
+        result = opened_for_validator.evaluate(ticket)
         assert result.passed is True
         assert result.score == 10
         assert result.max_score == 10
         assert result.criterion_id == "opened_for_correct"
         assert result.coaching is None
 
-    def test_fails_when_opened_for_empty(self):
+    def test_fails_when_opened_for_empty(self, opened_for_validator: OpenedForValidator):
         ticket = _make_ticket(opened_for="")
-        result = self.validator.evaluate(ticket)
+        result = opened_for_validator.evaluate(ticket)
         assert result.passed is False
         assert result.score == 0
         assert result.max_score == 10
         assert result.coaching is not None
         assert "Opened For" in result.coaching
 
-    def test_fails_when_opened_for_whitespace(self):
+    def test_fails_when_opened_for_whitespace(self, opened_for_validator: OpenedForValidator):
         ticket = _make_ticket(opened_for="   ")
-        result = self.validator.evaluate(ticket)
+        result = opened_for_validator.evaluate(ticket)
         assert result.passed is False
         assert result.score == 0
 
@@ -71,17 +75,14 @@ class TestOpenedForValidator:
 class TestRulesEvaluator:
     """Tests for RulesEvaluator orchestrator."""
 
-    def setup_method(self):
-        self.evaluator = RulesEvaluator()
-
-    def test_returns_single_result(self):
+    def test_returns_single_result(self, rules_evaluator: RulesEvaluator):
         ticket = _make_ticket(opened_for="user123")
-        results = self.evaluator.evaluate(ticket)
+        results = rules_evaluator.evaluate(ticket)
         assert len(results) == 1
         assert results[0].criterion_id == "opened_for_correct"
 
-    def test_get_rule_scores(self):
+    def test_get_rule_scores(self, rules_evaluator: RulesEvaluator):
         ticket = _make_ticket(opened_for="user123")
-        scores = self.evaluator.get_rule_scores(ticket)
+        scores = rules_evaluator.get_rule_scores(ticket)
         assert "opened_for_correct" in scores
         assert scores["opened_for_correct"].score == 10
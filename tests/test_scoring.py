@@ -1,11 +1,13 @@
 """Tests for the scoring engine module - Onsite Support Review (90 points)."""
 
 import time
-from datetime import datetime
-from unittest.mock import MagicMock
+from collections.abc import Callable
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
 
 import pytest
 
+from onsitereview.llm.evaluator import LLMEvaluator
 from onsitereview.models.evaluation import (
     CriterionScore,
     EvaluationResult,
@@ -13,6 +15,7 @@ from onsitereview.models.evaluation import (
     TemplateType,
 )
 from onsitereview.models.ticket import ServiceNowTicket
+from onsitereview.rules import RulesEvaluator
 from onsitereview.rules.base import RuleResult
 from onsitereview.scoring import (
     ONSITE_REVIEW_CRITERIA,
@@ -34,121 +37,87 @@ from onsitereview.scoring.templates import TemplateCriterion
 # ============================================================================
 
 
-@pytest.fixture
-def sample_ticket() -> ServiceNowTicket:
-    """Create a sample ticket for testing."""
-    return ServiceNowTicket(
-        number="INC1234567",
-        sys_id="abc123",
-        opened_at=datetime(2025, 12, 10, 4, 26, 0),
-        resolved_at=datetime(2025, 12, 10, 4, 41, 0),
-        closed_at=datetime(2025, 12, 15, 5, 0, 0),
-        caller_id="caller123",
-        opened_by="agent123",
-        assigned_to="agent123",
-        resolved_by="agent123",
-        closed_by="agent123",
-        opened_for="colleague123",
-        short_description="MMC-NCL Bangalore-VDI-error message",
-        description=(
-            "Validated by: Okta Push MFA & Full Name\n\n"
-            "Contact Number: 1234567890\n"
-            "Working remotely: Y\n\n"
-            "Issue/Request: Colleague is getting error message"
-        ),
-        close_notes="VDI reset, colleague confirmed working",
-        category="software",
-        subcategory="reset_restart",
-        contact_type="phone",
-        state="7",
-        incident_state="7",
-        priority="5",
-        impact="3",
-        urgency="3",
-        company="company123",
-        location="location123",
-        assignment_group="group123",
-        business_service="VDI Service",
-        cmdb_ci="VDI-NCL-001",
+def _rr(
+    criterion_id: str,
+    score: int,
+    max_score: int,
+    passed: bool = True,
+    evidence: str = "OK",
+    reasoning: str = "OK",
+    coaching: str | None = None,
+) -> RuleResult:
+    """Build a RuleResult with placeholder evidence/reasoning."""
+    return RuleResult(
+        criterion_id=criterion_id,
+        passed=passed,
+        score=score,
+        max_score=max_score,
+        evidence=evidence,
+        reasoning=reasoning,
+        coaching=coaching,
     )
 
 
-@pytest.fixture
-def rule_results() -> list[RuleResult]:
-    """Opened For rule result - perfect score."""
-    return [
-        RuleResult(
-            criterion_id="opened_for_correct",
-            passed=True,
-            score=10,
-            max_score=10,
-            evidence="Opened For: colleague123",
-            reasoning="Opened For field is populated",
-        ),
-    ]
+@pytest.fixture(scope="module")
+def calculator() -> ScoringCalculator:
+    """Shared scoring calculator (stateless)."""
+    return ScoringCalculator()
+
+
+@pytest.fixture(scope="module")
+def formatter() -> ResultFormatter:
+    """Shared result formatter (stateless)."""
+    return ResultFormatter()
 
 
 @pytest.fixture
-def llm_results() -> list[RuleResult]:
-    """LLM results for 7 criteria - perfect scores."""
-    return [
-        RuleResult(
-            criterion_id="correct_category",
-            passed=True,
-            score=5,
-            max_score=5,
-            evidence="Category: software",
-            reasoning="Correct category for VDI issue",
-        ),
-        RuleResult(
-            criterion_id="correct_subcategory",
-            passed=True,
-            score=5,
-            max_score=5,
-            evidence="Subcategory: reset_restart",
-            reasoning="Correct subcategory",
-        ),
-        RuleResult(
-            criterion_id="correct_service",
-            passed=True,
-            score=5,
-            max_score=5,
-            evidence="Service: VDI Service",
-            reasoning="Correct service identified",
-        ),
-        RuleResult(
-            criterion_id="correct_ci",
-            passed=True,
-            score=10,
-            max_score=10,
-            evidence="CI: VDI-NCL-001",
-            reasoning="Correct CI identified",
-        ),
-        RuleResult(
-            criterion_id="incident_notes",
-            passed=True,
-            score=20,
-            max_score=20,
-            evidence="Comprehensive notes with contact info and troubleshooting",
-            reasoning="All required elements present",
-        ),
-        RuleResult(
-            criterion_id="incident_handling",
-            passed=True,
-            score=15,
-            max_score=15,
-            evidence="Resolved at first contact",
-            reasoning="Correct handling procedure",
-        ),
-        RuleResult(
-            criterion_id="resolution_notes",
-            passed=True,
-            score=20,
-            max_score=20,
-            evidence="VDI reset, colleague confirmed working",
-            reasoning="Complete resolution with colleague confirmation",
-        ),
-    ]
+def stub_llm(make_stub_llm, llm_results: tuple[RuleResult, ...]):
+    """LLM evaluator stub returning perfect results."""
+    return make_stub_llm(list(llm_results))
+
+
+@pytest.fixture(scope="module")
+def make_evaluator(
+    rules_evaluator: RulesEvaluator,
+    calculator: ScoringCalculator,
+    formatter: ResultFormatter,
+) -> Callable[..., TicketEvaluator]:
+    """Build ticket evaluators that share the stateless pipeline components.
+
+    Only the LLM evaluator varies per test; pass ``None`` for rules only.
+    """
+
+    def make(llm_evaluator: LLMEvaluator | None = None) -> TicketEvaluator:
+        return TicketEvaluator(
+            rules_evaluator=rules_evaluator,
+            llm_evaluator=llm_evaluator,
+            calculator=calculator,
+            formatter=formatter,
+        )
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def rules_only_evaluator(make_evaluator: Callable[..., TicketEvaluator]) -> TicketEvaluator:
+    """Ticket evaluator with no LLM configured."""
+    return make_evaluator()
+
+
+@pytest.fixture(scope="module")
+def stub_evaluator(
+    make_evaluator: Callable[..., TicketEvaluator],
+    make_stub_llm,
+    llm_results: tuple[RuleResult, ...],
+) -> TicketEvaluator:
+    """Ticket evaluator whose LLM stub always returns perfect results."""
+    return make_evaluator(make_stub_llm(list(llm_results)))
+
+
+@pytest.fixture(scope="module")
+def batch_evaluator(stub_evaluator: TicketEvaluator) -> BatchTicketEvaluator:
+    """Batch evaluator over ``stub_evaluator`` (keeps no per-batch state)."""
+    return BatchTicketEvaluator(stub_evaluator)
 
 
 # ============================================================================
@@ -156,6 +125,19 @@ def llm_results() -> list[RuleResult]:
 # ============================================================================
 
 
+# criterion_id -> (max_points, source)
+_EXPECTED_CRITERIA = {
+    "correct_category": (5, "llm"),
+    "correct_subcategory": (5, "llm"),
+    "correct_service": (5, "llm"),
+    "correct_ci": (10, "llm"),
+    "opened_for_correct": (10, "rules"),
+    "incident_notes": (20, "llm"),
+    "incident_handling": (15, "llm"),
+    "resolution_notes": (20, "llm"),
+}
+
+
 class TestTemplates:
     """Tests for onsite support review template criteria."""
 
@@ -184,28 +166,21 @@ class TestTemplates:
         }
         assert ids == expected
 
-    def test_criteria_points(self):
+    @pytest.mark.parametrize(
+        "criterion_id,max_points",
+        [(cid, points) for cid, (points, _) in _EXPECTED_CRITERIA.items()],
+    )
+    def test_criteria_points(self, criterion_id, max_points):
         """Each criterion should have correct max points."""
-        expected_points = {
-            "correct_category": 5,
-            "correct_subcategory": 5,
-            "correct_service": 5,
-            "correct_ci": 10,
-            "opened_for_correct": 10,
-            "incident_notes": 20,
-            "incident_handling": 15,
-            "resolution_notes": 20,
-        }
-        for criterion in get_criteria():
-            assert criterion.max_points == expected_points[criterion.criterion_id]
+        assert get_criterion_by_id(criterion_id).max_points == max_points
 
-    def test_criteria_sources(self):
+    @pytest.mark.parametrize(
+        "criterion_id,source",
+        [(cid, source) for cid, (_, source) in _EXPECTED_CRITERIA.items()],
+    )
+    def test_criteria_sources(self, criterion_id, source):
         """Opened For should be rules, rest should be LLM."""
-        for criterion in get_criteria():
-            if criterion.criterion_id == "opened_for_correct":
-                assert criterion.source == "rules"
-            else:
-                assert criterion.source == "llm"
+        assert get_criterion_by_id(criterion_id).source == source
 
     def test_get_criterion_by_id(self):
         """Should find criterion by ID."""
@@ -231,6 +206,12 @@ class TestTemplates:
         assert criterion.source == "rules"
         assert criterion.required is True
 
+    def test_template_criterion_is_immutable(self):
+        """Template criteria are shared module constants and must not be mutated."""
+        criterion = get_criterion_by_id("correct_category")
+        with pytest.raises(FrozenInstanceError):
+            criterion.max_points = 50
+
     def test_onsite_review_criteria_exported(self):
         """ONSITE_REVIEW_CRITERIA should be importable."""
         assert len(ONSITE_REVIEW_CRITERIA) == 8
@@ -242,12 +223,15 @@ class TestTemplates:
 # ============================================================================
 
 
+# Three 50-point results, 150 in total, well over the 90-point cap
+_OVERSHOOT_RESULTS = tuple(_rr(f"test_{i}", 50, 50) for i in range(3))
+
+
 class TestScoringCalculator:
     """Tests for the scoring calculator."""
 
-    def test_perfect_score(self, rule_results, llm_results):
+    def test_perfect_score(self, calculator, rule_results, llm_results):
         """Perfect results should give 90/90."""
-        calculator = ScoringCalculator()
         result = calculator.calculate_score(rule_results, llm_results)
 
         assert result.total_score == 90
@@ -255,9 +239,8 @@ class TestScoringCalculator:
         assert result.passed is True
         assert result.band == PerformanceBand.BLUE
 
-    def test_zero_score(self):
+    def test_zero_score(self, calculator):
         """No results should give 0/90."""
-        calculator = ScoringCalculator()
         result = calculator.calculate_score([], [])
 
         assert result.total_score == 0
@@ -265,23 +248,14 @@ class TestScoringCalculator:
         assert result.passed is False
         assert result.band == PerformanceBand.PURPLE
 
-    def test_partial_score(self, rule_results):
+    def test_partial_score(self, calculator, rule_results):
         """Rules only should give partial score."""
-        calculator = ScoringCalculator()
         partial_llm = [
-            RuleResult(
-                criterion_id="correct_category",
-                passed=True,
-                score=5,
-                max_score=5,
-                evidence="Correct",
-                reasoning="OK",
-            ),
-            RuleResult(
-                criterion_id="incident_notes",
-                passed=True,
-                score=10,
-                max_score=20,
+            _rr("correct_category", 5, 5, evidence="Correct"),
+            _rr(
+                "incident_notes",
+                10,
+                20,
                 evidence="Partial notes",
                 reasoning="Missing some elements",
             ),
@@ -291,86 +265,60 @@ class TestScoringCalculator:
         assert result.total_score == 25  # 10 + 5 + 10
         assert result.passed is False
 
-    def test_score_capped_at_90(self):
+    def test_score_capped_at_90(self, calculator):
         """Score should never exceed 90."""
-        calculator = ScoringCalculator()
-        overshoot_results = [
-            RuleResult(
-                criterion_id=f"test_{i}",
-                passed=True,
-                score=50,
-                max_score=50,
-                evidence="OK",
-                reasoning="OK",
-            )
-            for i in range(3)
-        ]
-        result = calculator.calculate_score(overshoot_results, [])
+        result = calculator.calculate_score(_OVERSHOOT_RESULTS, [])
 
         assert result.total_score == 90
 
-    def test_pass_threshold_at_81(self):
+    def test_pass_threshold_at_81(self, calculator):
         """81/90 should pass, 80/90 should fail."""
-        calculator = ScoringCalculator()
-
         pass_results = [
-            RuleResult(
-                criterion_id="bulk",
-                passed=True,
-                score=81,
-                max_score=90,
-                evidence="OK",
-                reasoning="OK",
-            ),
+            _rr("bulk", 81, 90),
         ]
         result = calculator.calculate_score(pass_results, [])
         assert result.passed is True
 
         fail_results = [
-            RuleResult(
-                criterion_id="bulk",
-                passed=True,
-                score=80,
-                max_score=90,
-                evidence="OK",
-                reasoning="OK",
-            ),
+            _rr("bulk", 80, 90),
         ]
         result = calculator.calculate_score(fail_results, [])
         assert result.passed is False
 
-    def test_performance_bands(self):
+    @pytest.mark.parametrize(
+        "percentage,band",
+        [
+            (95.0, PerformanceBand.BLUE),
+            (100.0, PerformanceBand.BLUE),
+            (90.0, PerformanceBand.GREEN),
+            (94.9, PerformanceBand.GREEN),
+            (75.0, PerformanceBand.YELLOW),
+            (89.9, PerformanceBand.YELLOW),
+            (50.0, PerformanceBand.RED),
+            (74.9, PerformanceBand.RED),
+            (49.9, PerformanceBand.PURPLE),
+            (0.0, PerformanceBand.PURPLE),
+        ],
+    )
+    def test_performance_bands(self, calculator, percentage, band):
         """Performance bands should be assigned correctly."""
-        calculator = ScoringCalculator()
-
-        assert calculator.get_band(95.0) == PerformanceBand.BLUE
-        assert calculator.get_band(100.0) == PerformanceBand.BLUE
-        assert calculator.get_band(90.0) == PerformanceBand.GREEN
-        assert calculator.get_band(94.9) == PerformanceBand.GREEN
-        assert calculator.get_band(75.0) == PerformanceBand.YELLOW
-        assert calculator.get_band(89.9) == PerformanceBand.YELLOW
-        assert calculator.get_band(50.0) == PerformanceBand.RED
-        assert calculator.get_band(74.9) == PerformanceBand.RED
-        assert calculator.get_band(49.9) == PerformanceBand.PURPLE
-        assert calculator.get_band(0.0) == PerformanceBand.PURPLE
-
-    def test_calculate_percentage(self):
-        """Should calculate percentage from score."""
-        calculator = ScoringCalculator()
+        assert calculator.get_band(percentage) == band
 
-        assert calculator.calculate_percentage(90) == 100.0
-        assert calculator.calculate_percentage(81) == 90.0
-        assert calculator.calculate_percentage(45) == 50.0
-        assert calculator.calculate_percentage(0) == 0.0
+    @pytest.mark.parametrize(
+        "score,percentage",
+        [(90, 100.0), (81, 90.0), (45, 50.0), (0, 0.0)],
+    )
+    def test_calculate_percentage(self, calculator, score, percentage):
+        """Should calculate percentage from score."""
+        assert calculator.calculate_percentage(score) == percentage
 
-    def test_passed_method(self):
+    @pytest.mark.parametrize(
+        "percentage,passed",
+        [(90.0, True), (89.9, False), (100.0, True), (81 / 90 * 100, True)],
+    )
+    def test_passed_method(self, calculator, percentage, passed):
         """Should check pass threshold correctly."""
-        calculator = ScoringCalculator()
-
-        assert calculator.passed(90.0) is True
-        assert calculator.passed(89.9) is False
-        assert calculator.passed(100.0) is True
-        assert calculator.passed(81 / 90 * 100) is True
+        assert calculator.passed(percentage) is passed
 
 
 # ============================================================================
@@ -381,9 +329,8 @@ class TestScoringCalculator:
 class TestResultFormatter:
     """Tests for result formatting."""
 
-    def test_to_criterion_scores(self, rule_results, llm_results):
+    def test_to_criterion_scores(self, formatter, rule_results, llm_results):
         """Should convert RuleResults to CriterionScores."""
-        formatter = ResultFormatter()
         scores = formatter.to_criterion_scores(rule_results, llm_results)
 
         assert len(scores) == 8
@@ -391,26 +338,22 @@ class TestResultFormatter:
             assert isinstance(score, CriterionScore)
             assert score.points_awarded >= 0
 
-    def test_collect_strengths(self, rule_results, llm_results):
+    def test_collect_strengths(self, formatter, all_results):
         """Should identify high-scoring criteria as strengths."""
-        formatter = ResultFormatter()
-        all_results = rule_results + llm_results
         strengths = formatter.collect_strengths(all_results)
 
         assert len(strengths) > 0
         # Perfect scores should be identified as strengths
-        assert any("Category" in s for s in strengths)
+        assert "Category: Correct category for VDI issue" in strengths
 
-    def test_collect_improvements(self):
+    def test_collect_improvements(self, formatter):
         """Should identify low-scoring criteria for improvement."""
-        formatter = ResultFormatter()
-
         results = [
-            RuleResult(
-                criterion_id="correct_category",
+            _rr(
+                "correct_category",
+                0,
+                5,
                 passed=False,
-                score=0,
-                max_score=5,
                 evidence="Wrong category",
                 reasoning="Should be software",
                 coaching="Use software category for VDI issues",
@@ -420,27 +363,29 @@ class TestResultFormatter:
         improvements = formatter.collect_improvements(results)
 
         assert len(improvements) > 0
-        assert any("Category" in i for i in improvements)
+        assert improvements == ["Category: Use software category for VDI issues"]
 
-    def test_get_coaching_recommendations(self):
-        """Should collect coaching recommendations."""
-        formatter = ResultFormatter()
+    def test_collect_improvements_without_coaching(self, formatter):
+        """Improvements without coaching should fall back to the score."""
+        improvements = formatter.collect_improvements([_rr("correct_category", 0, 5)])
+
+        assert improvements == ["Category: Needs improvement - scored 0/5"]
 
+    def test_get_coaching_recommendations(self, formatter):
+        """Should collect coaching recommendations."""
         results = [
-            RuleResult(
-                criterion_id="correct_category",
-                passed=True,
-                score=0,
-                max_score=5,
+            _rr(
+                "correct_category",
+                0,
+                5,
                 evidence="Wrong category",
                 reasoning="Better category available",
                 coaching="Consider using 'software' for VDI issues",
             ),
-            RuleResult(
-                criterion_id="incident_notes",
-                passed=True,
-                score=10,
-                max_score=20,
+            _rr(
+                "incident_notes",
+                10,
+                20,
                 evidence="Partial notes",
                 reasoning="Missing contact info",
                 coaching="Include contact number and working location",
@@ -450,27 +395,24 @@ class TestResultFormatter:
         recommendations = formatter.get_coaching_recommendations(results)
 
         assert len(recommendations) == 2
-        assert any("VDI" in r for r in recommendations)
+        assert "[Category] Consider using 'software' for VDI issues" in recommendations
 
-    def test_format_summary_pass(self):
+    def test_format_summary_pass(self, formatter):
         """Should format passing summary."""
-        formatter = ResultFormatter()
         summary = formatter.format_summary(total_score=85, max_score=90, passed=True)
 
         assert "85/90" in summary
         assert "PASS" in summary
 
-    def test_format_summary_fail(self):
+    def test_format_summary_fail(self, formatter):
         """Should format failing summary."""
-        formatter = ResultFormatter()
         summary = formatter.format_summary(total_score=70, max_score=90, passed=False)
 
         assert "70/90" in summary
         assert "FAIL" in summary
 
-    def test_format_score_breakdown(self):
+    def test_format_score_breakdown(self, formatter):
         """Should format criterion scores as text."""
-        formatter = ResultFormatter()
         scores = [
             CriterionScore(
                 criterion_id="correct_category",
@@ -494,9 +436,8 @@ class TestResultFormatter:
         assert "Category: 5/5" in breakdown
         assert "Incident Notes: 10/20" in breakdown
 
-    def test_generate_path_to_passing_already_passing(self):
+    def test_generate_path_to_passing_already_passing(self, formatter):
         """Should congratulate when already passing."""
-        formatter = ResultFormatter()
         scores = [
             CriterionScore(
                 criterion_id="correct_category",
@@ -512,9 +453,8 @@ class TestResultFormatter:
         assert len(recs) == 1
         assert recs[0]["category"] == "success"
 
-    def test_generate_path_to_passing_needs_improvement(self):
+    def test_generate_path_to_passing_needs_improvement(self, formatter):
         """Should generate recommendations when below passing."""
-        formatter = ResultFormatter()
         scores = [
             CriterionScore(
                 criterion_id="correct_category",
@@ -541,9 +481,8 @@ class TestResultFormatter:
         assert len(recs) >= 2
         assert recs[0]["category"] == "summary"
 
-    def test_criterion_improvement_actions(self):
+    def test_criterion_improvement_actions(self, formatter):
         """Should generate specific improvement actions for known criteria."""
-        formatter = ResultFormatter()
         opp = {
             "criterion_id": "opened_for_correct",
             "criterion_name": "Opened For",
@@ -556,9 +495,8 @@ class TestResultFormatter:
         action, details = formatter._get_criterion_improvement_action(opp)
         assert "Opened For" in action
 
-    def test_format_category_names(self):
+    def test_format_category_names(self, formatter):
         """Should map criterion IDs to readable names."""
-        formatter = ResultFormatter()
         names = formatter._format_category_names(
             ["correct_category", "opened_for_correct", "incident_notes"]
         )
@@ -573,13 +511,9 @@ class TestResultFormatter:
 class TestTicketEvaluator:
     """Tests for the ticket evaluator orchestrator."""
 
-    def test_evaluate_with_mocked_llm(self, sample_ticket, llm_results):
+    def test_evaluate_with_mocked_llm(self, sample_ticket, stub_evaluator):
         """Should run complete evaluation with mocked LLM."""
-        mock_llm = MagicMock()
-        mock_llm.evaluate_ticket.return_value = llm_results
-
-        evaluator = TicketEvaluator(llm_evaluator=mock_llm)
-        result = evaluator.evaluate_ticket(sample_ticket)
+        result = stub_evaluator.evaluate_ticket(sample_ticket)
 
         assert isinstance(result, EvaluationResult)
         assert result.ticket_number == "INC1234567"
@@ -587,58 +521,59 @@ class TestTicketEvaluator:
         assert result.max_score == 90
         assert 0 <= result.total_score <= 90
 
-    def test_evaluate_rules_only(self, sample_ticket):
+    def test_evaluate_rules_only(self, rules_only_evaluator, sample_ticket):
         """Should run rules-only evaluation."""
-        evaluator = TicketEvaluator()
-        results = evaluator.evaluate_rules_only(sample_ticket)
+        results = rules_only_evaluator.evaluate_rules_only(sample_ticket)
 
         assert isinstance(results, list)
         assert all(isinstance(r, RuleResult) for r in results)
         # Should have opened_for result
-        assert any(r.criterion_id == "opened_for_correct" for r in results)
+        assert "opened_for_correct" in {r.criterion_id for r in results}
 
-    def test_evaluate_llm_only_without_llm_raises(self, sample_ticket):
-        """Should raise if no LLM configured for llm_only."""
-        evaluator = TicketEvaluator()
+    def test_evaluate_rules_only_missing_opened_for(self, rules_only_evaluator, make_sample_ticket):
+        """A ticket without Opened For should score zero on that rule."""
+        results = rules_only_evaluator.evaluate_rules_only(make_sample_ticket(opened_for=""))
+
+        opened_for = next(r for r in results if r.criterion_id == "opened_for_correct")
+        assert opened_for.score == 0
+        assert opened_for.passed is False
 
+    def test_evaluate_llm_only_without_llm_raises(self, rules_only_evaluator, sample_ticket):
+        """Should raise if no LLM configured for llm_only."""
         with pytest.raises(ValueError, match="No LLM evaluator"):
-            evaluator.evaluate_llm_only(sample_ticket)
+            rules_only_evaluator.evaluate_llm_only(sample_ticket)
 
-    def test_get_raw_results(self, sample_ticket):
+    def test_get_raw_results(self, sample_ticket, stub_llm, make_evaluator):
         """Should return raw results tuple."""
-        mock_llm = MagicMock()
-        mock_llm.evaluate_ticket.return_value = []
+        stub_llm.return_value = []
 
-        evaluator = TicketEvaluator(llm_evaluator=mock_llm)
+        evaluator = make_evaluator(stub_llm)
         rule_results, llm_results = evaluator.get_raw_results(sample_ticket)
 
         assert isinstance(rule_results, list)
         assert isinstance(llm_results, list)
 
-    def test_get_coaching_recommendations(self, sample_ticket):
+    def test_get_coaching_recommendations(self, sample_ticket, stub_llm, make_evaluator):
         """Should return coaching recommendations."""
-        mock_llm = MagicMock()
-        mock_llm.evaluate_ticket.return_value = [
-            RuleResult(
-                criterion_id="correct_category",
-                passed=True,
-                score=0,
-                max_score=5,
+        stub_llm.return_value = [
+            _rr(
+                "correct_category",
+                0,
+                5,
                 evidence="Wrong",
                 reasoning="Incorrect",
                 coaching="Use software category",
             ),
         ]
 
-        evaluator = TicketEvaluator(llm_evaluator=mock_llm)
+        evaluator = make_evaluator(stub_llm)
         recs = evaluator.get_coaching_recommendations(sample_ticket)
 
         assert isinstance(recs, list)
 
-    def test_evaluate_without_llm(self, sample_ticket):
+    def test_evaluate_without_llm(self, rules_only_evaluator, sample_ticket):
         """Should evaluate with rules only when no LLM configured."""
-        evaluator = TicketEvaluator()
-        result = evaluator.evaluate_ticket(sample_ticket)
+        result = rules_only_evaluator.evaluate_ticket(sample_ticket)
 
         assert isinstance(result, EvaluationResult)
         assert result.total_score <= 90
@@ -661,6 +596,13 @@ class TestBatchTicketEvaluator:
         assert progress.percentage == 50.0
         assert progress.elapsed_seconds >= 0
 
+    def test_batch_progress_is_slotted(self):
+        """BatchProgress should reject attributes outside its fields."""
+        progress = BatchProgress(total=10, completed=5)
+
+        with pytest.raises(AttributeError):
+            progress.eta = 0.0
+
     def test_batch_progress_zero_total(self):
         """BatchProgress should handle zero total."""
         progress = BatchProgress(total=0, completed=0)
@@ -668,21 +610,14 @@ class TestBatchTicketEvaluator:
 
     def test_batch_progress_estimated_remaining(self):
         """BatchProgress should estimate remaining time."""
-        progress = BatchProgress(
-            total=10, completed=5, start_time=time.time() - 10
-        )
+        progress = BatchProgress(total=10, completed=5, start_time=990.0)
 
-        remaining = progress.estimated_remaining_seconds
-        assert 8 <= remaining <= 12
+        with patch("onsitereview.scoring.batch.time.monotonic", return_value=1000.0):
+            remaining = progress.estimated_remaining_seconds
+        assert remaining == 10.0
 
-    def test_evaluate_batch(self, sample_ticket, llm_results):
+    def test_evaluate_batch(self, sample_ticket, batch_evaluator):
         """Should evaluate batch of tickets."""
-        mock_llm = MagicMock()
-        mock_llm.evaluate_ticket.return_value = llm_results
-
-        evaluator = TicketEvaluator(llm_evaluator=mock_llm)
-        batch_evaluator = BatchTicketEvaluator(evaluator)
-
         tickets = [sample_ticket, sample_ticket]
         result = batch_evaluator.evaluate_batch(tickets)
 
@@ -690,14 +625,17 @@ class TestBatchTicketEvaluator:
         assert len(result.errors) == 0
         assert result.summary.total_tickets == 2
 
-    def test_batch_with_progress_callback(self, sample_ticket, llm_results):
-        """Should call progress callback."""
-        mock_llm = MagicMock()
-        mock_llm.evaluate_ticket.return_value = llm_results
+    def test_evaluate_batch_keeps_ticket_order(self, make_sample_ticket, batch_evaluator):
+        """Results should follow input order even when evaluated concurrently."""
+        numbers = [f"INC{i:07d}" for i in range(12)]
+        tickets = [make_sample_ticket(number=n) for n in numbers]
 
-        evaluator = TicketEvaluator(llm_evaluator=mock_llm)
-        batch_evaluator = BatchTicketEvaluator(evaluator)
+        result = batch_evaluator.evaluate_batch(tickets)
+
+        assert [r.ticket_number for r in result.results] == numbers
 
+    def test_batch_with_progress_callback(self, sample_ticket, batch_evaluator):
+        """Should call progress callback."""
         progress_updates = []
 
         def callback(progress: BatchProgress):
@@ -708,15 +646,14 @@ class TestBatchTicketEvaluator:
 
         assert len(progress_updates) >= 2
 
-    def test_batch_handles_errors(self, sample_ticket, llm_results):
+    def test_batch_handles_errors(self, sample_ticket, llm_results, make_evaluator, make_stub_llm):
         """Should handle evaluation errors gracefully."""
-        mock_llm = MagicMock()
-        mock_llm.evaluate_ticket.side_effect = [
-            llm_results,
-            Exception("API Error"),
-        ]
+        stub_llm = make_stub_llm(
+            [],
+            side_effect=iter([list(llm_results), Exception("API Error")]),
+        )
 
-        evaluator = TicketEvaluator(llm_evaluator=mock_llm)
+        evaluator = make_evaluator(stub_llm)
         batch_evaluator = BatchTicketEvaluator(evaluator)
 
         tickets = [sample_ticket, sample_ticket]
@@ -726,10 +663,41 @@ class TestBatchTicketEvaluator:
         assert len(result.errors) == 1
         assert "API Error" in result.errors[0][1]
 
-    def test_generate_summary(self):
-        """Should generate batch summary."""
-        batch_evaluator = BatchTicketEvaluator(MagicMock())
+    def test_batch_abort_cancels_queued_tickets(
+        self, make_sample_ticket, llm_results, make_evaluator
+    ):
+        """A callback that raises should stop tickets that have not started."""
+
+        class Abort(BaseException):
+            """Stands in for Streamlit's stop/rerun exceptions."""
+
+        class SlowLLM:
+            """Records each call, then answers after a short delay."""
+
+            def __init__(self) -> None:
+                self.calls: list[str] = []
 
+            def evaluate_ticket(self, ticket: ServiceNowTicket) -> list[RuleResult]:
+                self.calls.append(ticket.number)
+                time.sleep(0.02)
+                return list(llm_results)
+
+        def abort_after_first(progress: BatchProgress) -> None:
+            if progress.completed:
+                raise Abort
+
+        slow_llm = SlowLLM()
+        batch_evaluator = BatchTicketEvaluator(make_evaluator(slow_llm), concurrency=2)
+        tickets = [make_sample_ticket(number=f"INC{i:07d}") for i in range(40)]
+
+        with pytest.raises(Abort):
+            batch_evaluator.evaluate_batch(tickets, progress_callback=abort_after_first)
+
+        # Only tickets already running (at most one more per worker) may finish
+        assert len(slow_llm.calls) <= 2 * batch_evaluator.concurrency
+
+    def test_generate_summary(self, batch_evaluator):
+        """Should generate batch summary."""
         results = [
             EvaluationResult(
                 ticket_number="INC001",
@@ -754,11 +722,11 @@ class TestBatchTicketEvaluator:
         assert summary.failed_count == 1  # 70/90 fails
         assert summary.average_score == 80.0
         assert PerformanceBand.BLUE.value in summary.band_distribution
+        assert list(summary.band_distribution) == [band.value for band in PerformanceBand]
+        assert sum(summary.band_distribution.values()) == 2
 
-    def test_generate_summary_empty(self):
+    def test_generate_summary_empty(self, batch_evaluator):
         """Should handle empty results."""
-        batch_evaluator = BatchTicketEvaluator(MagicMock())
-
         summary = batch_evaluator.generate_summary([])
 
         assert summary.total_tickets == 0
@@ -773,13 +741,9 @@ class TestBatchTicketEvaluator:
 class TestIntegration:
     """Integration tests combining multiple components."""
 
-    def test_full_pipeline_perfect_ticket(self, sample_ticket, llm_results):
+    def test_full_pipeline_perfect_ticket(self, sample_ticket, stub_evaluator):
         """Full evaluation pipeline for a perfect ticket."""
-        mock_llm = MagicMock()
-        mock_llm.evaluate_ticket.return_value = llm_results
-
-        evaluator = TicketEvaluator(llm_evaluator=mock_llm)
-        result = evaluator.evaluate_ticket(sample_ticket)
+        result = stub_evaluator.evaluate_ticket(sample_ticket)
 
         assert result.ticket_number == sample_ticket.number
         assert result.template == TemplateType.ONSITE_REVIEW
@@ -790,23 +754,19 @@ class TestIntegration:
         assert result.passed is True
         assert result.band == PerformanceBand.BLUE
 
-    def test_scoring_calculator_with_evaluator(self, sample_ticket):
+    def test_scoring_calculator_with_evaluator(
+        self, rules_only_evaluator, calculator, sample_ticket
+    ):
         """Calculator should work with evaluator results."""
-        evaluator = TicketEvaluator()
-        calculator = ScoringCalculator()
-
-        rule_results = evaluator.evaluate_rules_only(sample_ticket)
+        rule_results = rules_only_evaluator.evaluate_rules_only(sample_ticket)
         scoring_result = calculator.calculate_score(rule_results, [])
 
         assert isinstance(scoring_result, ScoringResult)
         assert scoring_result.max_score == 90
 
-    def test_formatter_with_evaluator(self, sample_ticket):
+    def test_formatter_with_evaluator(self, rules_only_evaluator, formatter, sample_ticket):
         """Formatter should work with evaluator results."""
-        evaluator = TicketEvaluator()
-        formatter = ResultFormatter()
-
-        rule_results = evaluator.evaluate_rules_only(sample_ticket)
+        rule_results = rules_only_evaluator.evaluate_rules_only(sample_ticket)
         criterion_scores = formatter.to_criterion_scores(rule_results, [])
 
         assert isinstance(criterion_scores, list)